@@ -305,33 +305,37 @@ def post_video(
 def get_media(
     instagram_business_id: str,
     limit: int = 25,
-    fields: str = "id,caption,media_type,media_url,thumbnail_url,permalink,timestamp,like_count,comments_count"
+    fields: str = "id,caption,media_type,media_url,thumbnail_url,permalink,timestamp,like_count,comments_count",
+    after: str = ""
 ) -> dict[str, Any]:
     """
     Retrieve Instagram media posts from business account with basic metadata.
-    
+
     Args:
         instagram_business_id: Instagram Business Account ID
         limit: Number of media items to retrieve (max 100)
         fields: Comma-separated list of fields to retrieve
-    
+        after: Pagination cursor from a previous call's after_cursor
+
     Returns:
-        Dictionary with media list, total_count, next_page
+        Dictionary with media list, total_count, next_page, after_cursor
     """
     if limit > 100:
         limit = 100
-    
+
     _check_rate_limit()
-    
+
     def _execute() -> dict[str, Any]:
         graph = _get_graph_api()
-        
+
         # Get media
+        kwargs: dict[str, Any] = {'fields': fields, 'limit': limit}
+        if after:
+            kwargs['after'] = after
         response = graph.get_connection(
             object_id=instagram_business_id,
             connection="media",
-            fields=fields,
-            limit=limit
+            **kwargs
         )
         
         # Format media
@@ -348,10 +352,12 @@ def get_media(
                     'comments_count': item.get('comments_count', 0)
                 })
         
+        paging = response.get('paging', {})
         return {
             'media': media_list,
             'total_count': len(media_list),
-            'next_page': response.get('paging', {}).get('next', '')
+            'next_page': paging.get('next', ''),
+            'after_cursor': paging.get('cursors', {}).get('after', '')
         }
     
     try:
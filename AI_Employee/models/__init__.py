@@ -34,6 +34,7 @@ from .action_item import ActionItem, create_action_file, parse_action_file
 from .processed_tracker import ProcessedTracker
 from .approval_request import (
     ApprovalRequest,
+    approval_from_frontmatter,
     create_approval_file as create_approval_request_file,
     parse_approval_file,
 )
@@ -41,7 +42,7 @@ from .mcp_server import MCPServer
 from .watcher_instance import WatcherInstance, WatcherConfig, WatcherHealth
 
 # Gold Tier Models
-from .business_goal import BusinessGoal, Metric
+from .business_goal import BusinessGoal, Metric, calculate_completion_batch
 from .xero_transaction import XeroTransaction, LineItem
 from .social_media_post import SocialMediaPost, EngagementMetrics
 from .cross_domain_workflow import CrossDomainWorkflow, WorkflowStep
@@ -59,6 +60,7 @@ __all__ = [
     'ProcessedTracker',
     # Silver tier
     'ApprovalRequest',
+    'approval_from_frontmatter',
     'create_approval_request_file',
     'parse_approval_file',
     'MCPServer',
@@ -68,6 +70,7 @@ __all__ = [
     # Gold tier
     'BusinessGoal',
     'Metric',
+    'calculate_completion_batch',
     'XeroTransaction',
     'LineItem',
     'SocialMediaPost',
@@ -5,20 +5,119 @@ Defines the ApprovalRequest dataclass and helper functions for creating
 approval request files in the Obsidian vault.
 """
 
+import os
 import re
-import uuid
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Literal
+from typing import Any, Iterator, Literal
+
+from ._id_pool import new_id
 
 
 ActionType = Literal['email_send', 'linkedin_post', 'browser_action', 'custom']
 RiskLevel = Literal['low', 'medium', 'high']
 StatusType = Literal['pending', 'approved', 'rejected', 'executed']
 
+# Translation table for YAML string escaping (single-pass via str.translate)
+_YAML_ESCAPE_TABLE = str.maketrans({'\\': '\\\\', '"': '\\"'})
+
+# URL detection for risk assessment (only run on 'http' candidates)
+_URL_RE = re.compile(r'https?://')
+
+# Characters that force quoting of a YAML scalar
+_YAML_UNSAFE_CHARS = '\\"\n:#-[]{},&*!|>\'%@`'
+
+
+def _build_frontmatter_template(
+    has_approval: bool, has_execution: bool, has_approver: bool
+) -> str:
+    """Build one frontmatter template for a null/non-null combination."""
+    return '\n'.join((
+        '---',
+        'type: approval_request',
+        'id: {id}',
+        'action_type: {action_type}',
+        'target: {target}',
+        'risk_level: {risk_level}',
+        'rationale: {rationale}',
+        'created_timestamp: {created}',
+        'status: {status}',
+        'approval_timestamp: {approval}' if has_approval
+        else 'approval_timestamp: null',
+        'approver: {approver}' if has_approver else 'approver: null',
+        'execution_timestamp: {execution}' if has_execution
+        else 'execution_timestamp: null',
+        'source_action_item: {source}',
+        'mcp_server: {mcp_server}',
+        'mcp_tool: {mcp_tool}',
+        '---',
+    ))
+
+
+# Frontmatter skeletons keyed by a 3-bit mask of which optional fields
+# are set: bit 2 = approval_timestamp, bit 1 = execution_timestamp,
+# bit 0 = approver. The 'null' literals are baked into the template.
+_FRONTMATTER_TEMPLATES = {
+    (a << 2) | (e << 1) | p: _build_frontmatter_template(bool(a), bool(e), bool(p))
+    for a in (0, 1) for e in (0, 1) for p in (0, 1)
+}
+
+# Bytes versions of the same skeletons using %(name)s placeholders, so
+# the static fragments are encoded once at import instead of per write.
+_FRONTMATTER_TEMPLATES_BYTES = {
+    mask: re.sub(r'\{(\w+)\}', r'%(\1)s', template).encode('ascii')
+    for mask, template in _FRONTMATTER_TEMPLATES.items()
+}
+
+
+# Bare lexemes the YAML 1.1 resolver re-types as bool/null/special
+# (compared lowercased, covering every case variant PyYAML accepts);
+# emitting these unquoted would corrupt the value on a safe_load
+# round-trip, e.g. 'target: yes' parsing back as True
+_YAML_RESERVED = frozenset((
+    'null', '~', 'true', 'false', 'yes', 'no', 'on', 'off',
+    'y', 'n', '=', '.nan', '.inf',
+))
+
+# Leading characters of int/float lexemes ('-' is already unsafe)
+_YAML_NUMERIC_LEAD = '0123456789+.'
+
+# Render-cache slots invalidated when their source field is assigned
+_RENDER_CACHE_FIELDS = {
+    'created_timestamp': ('_created_iso', '_filename_ts', '_human_ts'),
+    'target': ('_target_yaml',),
+    'rationale': ('_rationale_yaml',),
+}
+
+
+def _yaml_scalar(text: str) -> str:
+    """
+    Render a string as a YAML scalar, quoting only when needed.
 
-@dataclass
+    Plain ASCII values without YAML-significant characters are emitted
+    unquoted; everything else is escaped and double-quoted. Anything a
+    YAML parser would resolve to a non-string type - the bool/null
+    lexeme set and number-like scalars - is quoted so values always
+    round-trip as the identical string.
+    """
+    if (
+        text
+        and text.isascii()
+        and not any(c in text for c in _YAML_UNSAFE_CHARS)
+        and not text[0].isspace()
+        and not text[-1].isspace()
+        and text[0] not in _YAML_NUMERIC_LEAD
+        and text.lower() not in _YAML_RESERVED
+    ):
+        return text
+    if '\\' in text or '"' in text:
+        text = text.translate(_YAML_ESCAPE_TABLE)
+    return f'"{text}"'
+
+
+@dataclass(slots=True)
 class ApprovalRequest:
     """
     Represents a proposed external action awaiting human approval.
@@ -42,7 +141,7 @@ class ApprovalRequest:
         notes: Additional context or considerations.
     """
 
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=new_id)
     action_type: ActionType = 'custom'
     target: str = ''
     risk_level: RiskLevel = 'medium'
@@ -59,6 +158,65 @@ class ApprovalRequest:
     risk_factors: list[str] = field(default_factory=list)
     notes: str = ''
 
+    # Render caches, filled lazily on first use (declared for slots).
+    # Assigning to a source field clears its caches via __setattr__, so
+    # post-construction mutation is reflected in later renders.
+    _created_iso: str | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _filename_ts: str | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _human_ts: str | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _target_yaml: str | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _rationale_yaml: str | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Assign the field, invalidating any render cache built on it."""
+        object.__setattr__(self, name, value)
+        for cache in _RENDER_CACHE_FIELDS.get(name, ()):
+            object.__setattr__(self, cache, None)
+
+    def _iso_created(self) -> str:
+        """ISO timestamp, cached until created_timestamp changes."""
+        if self._created_iso is None:
+            self._created_iso = self.created_timestamp.isoformat()
+        return self._created_iso
+
+    def _filename_timestamp(self) -> str:
+        """Filename timestamp, cached until created_timestamp changes."""
+        if self._filename_ts is None:
+            self._filename_ts = self.created_timestamp.strftime(
+                '%Y%m%d-%H%M%S'
+            )
+        return self._filename_ts
+
+    def _human_timestamp(self) -> str:
+        """Readable timestamp, cached until created_timestamp changes."""
+        if self._human_ts is None:
+            self._human_ts = self.created_timestamp.strftime(
+                '%Y-%m-%d %H:%M:%S'
+            )
+        return self._human_ts
+
+    def _yaml_target(self) -> str:
+        """YAML-rendered target, cached until target changes."""
+        if self._target_yaml is None:
+            self._target_yaml = _yaml_scalar(self.target)
+        return self._target_yaml
+
+    def _yaml_rationale(self) -> str:
+        """YAML-rendered rationale, cached until rationale changes."""
+        if self._rationale_yaml is None:
+            self._rationale_yaml = _yaml_scalar(self.rationale)
+        return self._rationale_yaml
+
     def to_frontmatter(self) -> str:
         """
         Generate YAML frontmatter string for the approval request.
@@ -66,32 +224,65 @@ class ApprovalRequest:
         Returns:
             YAML frontmatter including opening/closing delimiters.
         """
-        approval_ts = (
-            self.approval_timestamp.isoformat()
-            if self.approval_timestamp else 'null'
-        )
-        execution_ts = (
-            self.execution_timestamp.isoformat()
-            if self.execution_timestamp else 'null'
+        # Pick the prebuilt skeleton for this null/non-null combination
+        mask = self._optional_mask()
+        values = {
+            'id': _yaml_scalar(self.id),
+            'action_type': self.action_type,
+            'target': self._yaml_target(),
+            'risk_level': self.risk_level,
+            'rationale': self._yaml_rationale(),
+            'created': self._iso_created(),
+            'status': self.status,
+            'source': _yaml_scalar(self.source_action_item),
+            'mcp_server': _yaml_scalar(self.mcp_server),
+            'mcp_tool': _yaml_scalar(self.mcp_tool),
+        }
+        if self.approval_timestamp:
+            values['approval'] = self.approval_timestamp.isoformat()
+        if self.execution_timestamp:
+            values['execution'] = self.execution_timestamp.isoformat()
+        if self.approver:
+            values['approver'] = _yaml_scalar(self.approver)
+        return _FRONTMATTER_TEMPLATES[mask].format_map(values)
+
+    def _optional_mask(self) -> int:
+        """Pack which optional fields are set into the template key."""
+        return (
+            (bool(self.approval_timestamp) << 2)
+            | (bool(self.execution_timestamp) << 1)
+            | bool(self.approver)
         )
-        approver_val = f'"{self.approver}"' if self.approver else 'null'
-
-        return f"""---
-type: approval_request
-id: "{self.id}"
-action_type: {self.action_type}
-target: "{self._escape_yaml_string(self.target)}"
-risk_level: {self.risk_level}
-rationale: "{self._escape_yaml_string(self.rationale)}"
-created_timestamp: {self.created_timestamp.isoformat()}
-status: {self.status}
-approval_timestamp: {approval_ts}
-approver: {approver_val}
-execution_timestamp: {execution_ts}
-source_action_item: "{self.source_action_item}"
-mcp_server: "{self.mcp_server}"
-mcp_tool: "{self.mcp_tool}"
----"""
+
+    def to_frontmatter_bytes(self) -> bytes:
+        """
+        Generate the frontmatter as UTF-8 bytes.
+
+        Uses the pre-encoded byte skeletons so the static fragments are
+        never re-encoded; only the dynamic values pass through encode.
+
+        Returns:
+            Frontmatter including delimiters, encoded as UTF-8.
+        """
+        values = {
+            b'id': _yaml_scalar(self.id).encode('utf-8'),
+            b'action_type': self.action_type.encode('ascii'),
+            b'target': self._yaml_target().encode('utf-8'),
+            b'risk_level': self.risk_level.encode('ascii'),
+            b'rationale': self._yaml_rationale().encode('utf-8'),
+            b'created': self._iso_created().encode('ascii'),
+            b'status': self.status.encode('ascii'),
+            b'source': _yaml_scalar(self.source_action_item).encode('utf-8'),
+            b'mcp_server': _yaml_scalar(self.mcp_server).encode('utf-8'),
+            b'mcp_tool': _yaml_scalar(self.mcp_tool).encode('utf-8'),
+        }
+        if self.approval_timestamp:
+            values[b'approval'] = self.approval_timestamp.isoformat().encode('ascii')
+        if self.execution_timestamp:
+            values[b'execution'] = self.execution_timestamp.isoformat().encode('ascii')
+        if self.approver:
+            values[b'approver'] = _yaml_scalar(self.approver).encode('utf-8')
+        return _FRONTMATTER_TEMPLATES_BYTES[self._optional_mask()] % values
 
     def to_body(self) -> str:
         """
@@ -114,37 +305,25 @@ mcp_tool: "{self.mcp_tool}"
 
         action_description = self._get_action_description()
 
-        return f"""## Proposed Action
-
-{action_description}
-
-## Action Parameters
-
-{params_display}
-
-## Risk Assessment
-
-**Risk Level**: {self.risk_level.upper()}
-
-**Risk Factors**:
-{risk_factors_display}
-
-## Approval Instructions
-
-**To APPROVE**: Move this file to `/Approved/`
-**To REJECT**: Move this file to `/Rejected/`
-
-## Notes
-
-{self.notes if self.notes else 'No additional notes.'}
-
-## Metadata
-
-- **Source Action Item**: [[{self.source_action_item}]]
-- **MCP Server**: {self.mcp_server}
-- **MCP Tool**: {self.mcp_tool}
-- **Created**: {self.created_timestamp.strftime('%Y-%m-%d %H:%M:%S')}
-"""
+        parts = [
+            '## Proposed Action\n\n', action_description,
+            '\n\n## Action Parameters\n\n', params_display,
+            '\n\n## Risk Assessment\n\n**Risk Level**: ',
+            self.risk_level.upper(),
+            '\n\n**Risk Factors**:\n', risk_factors_display,
+            '\n\n## Approval Instructions\n\n'
+            '**To APPROVE**: Move this file to `/Approved/`\n'
+            '**To REJECT**: Move this file to `/Rejected/`\n\n'
+            '## Notes\n\n',
+            self.notes if self.notes else 'No additional notes.',
+            '\n\n## Metadata\n\n- **Source Action Item**: [[',
+            self.source_action_item,
+            ']]\n- **MCP Server**: ', self.mcp_server,
+            '\n- **MCP Tool**: ', self.mcp_tool,
+            '\n- **Created**: ', self._human_timestamp(),
+            '\n',
+        ]
+        return ''.join(parts)
 
     def _get_action_description(self) -> str:
         """
@@ -177,7 +356,22 @@ mcp_tool: "{self.mcp_tool}"
         Returns:
             Complete Markdown with frontmatter and body.
         """
-        return f"{self.to_frontmatter()}\n\n{self.to_body()}"
+        return ''.join((self.to_frontmatter(), '\n\n', self.to_body()))
+
+    def write_markdown(self, fh) -> None:
+        """
+        Stream the Markdown content into a binary file handle.
+
+        Writes frontmatter and body as separate encoded chunks instead
+        of concatenating the full document first, keeping peak memory at
+        one section rather than the whole file.
+
+        Args:
+            fh: Writable binary file object.
+        """
+        fh.write(self.to_frontmatter_bytes())
+        fh.write(b'\n\n')
+        fh.write(self.to_body().encode('utf-8'))
 
     def generate_filename(self) -> str:
         """
@@ -188,8 +382,7 @@ mcp_tool: "{self.mcp_tool}"
         Returns:
             The generated filename.
         """
-        timestamp = self.created_timestamp.strftime('%Y%m%d-%H%M%S')
-        return f"APPROVAL_{self.action_type}_{timestamp}.md"
+        return f"APPROVAL_{self.action_type}_{self._filename_timestamp()}.md"
 
     @staticmethod
     def _escape_yaml_string(text: str) -> str:
@@ -202,7 +395,10 @@ mcp_tool: "{self.mcp_tool}"
         Returns:
             Escaped text safe for YAML.
         """
-        return text.replace('\\', '\\\\').replace('"', '\\"')
+        # Most values contain nothing to escape - skip the translate pass
+        if '\\' not in text and '"' not in text:
+            return text
+        return text.translate(_YAML_ESCAPE_TABLE)
 
     @staticmethod
     def _slugify(text: str, max_length: int = 30) -> str:
@@ -253,9 +449,9 @@ def create_approval_file(
         # Ensure directory exists
         pending_approval_path.mkdir(parents=True, exist_ok=True)
 
-        # Write the file
-        content = approval_request.to_markdown()
-        file_path.write_text(content, encoding='utf-8')
+        # Stream the file through a 64 KB buffer
+        with open(file_path, 'wb', buffering=64 * 1024) as fh:
+            approval_request.write_markdown(fh)
         return file_path
 
     except OSError as e:
@@ -298,13 +494,13 @@ def create_linkedin_post_approval(
     if hashtags is None:
         hashtags = ['AI', 'Automation', 'Innovation']
 
-    # Check if link is present
-    has_link = 'http://' in post_text or 'https://' in post_text
+    # Length is O(1); link check is one substring scan with regex on hit
+    text_length = len(post_text)
+    has_link = 'http' in post_text and bool(_URL_RE.search(post_text))
 
     # Determine risk level based on Company_Handbook.md rules
     # Low: <200 chars, no links, matches approved topics
     # Medium: >=200 chars OR contains links
-    text_length = len(post_text)
     is_low_risk = text_length < max_auto_approve_length and not has_link
 
     risk_level: RiskLevel = 'low' if is_low_risk else 'medium'
@@ -338,7 +534,7 @@ def create_linkedin_post_approval(
             'text': full_post_text,
             'visibility': visibility,
             'hashtags': hashtags,
-            'content_preview': post_text[:100] + '...' if len(post_text) > 100 else post_text,
+            'content_preview': post_text[:100] + '...' if text_length > 100 else post_text,
             'character_count': text_length,
             'has_link': has_link,
             'auto_approval_eligible': auto_approvable
@@ -359,6 +555,61 @@ def create_linkedin_post_approval(
     return approval, file_path
 
 
+def _coerce_timestamp(value: Any) -> datetime | None:
+    """Normalize a frontmatter timestamp (datetime, ISO string, or null)."""
+    if isinstance(value, datetime):
+        return value
+    if isinstance(value, str) and value and value != 'null':
+        return datetime.fromisoformat(value)
+    return None
+
+
+def approval_from_frontmatter(data: dict[str, Any]) -> ApprovalRequest | None:
+    """
+    Build an ApprovalRequest from already-parsed frontmatter.
+
+    Lets the orchestrator reuse the dict produced during validation
+    instead of re-reading and re-parsing the file. Returns None when
+    a field the YAML resolver re-typed (bool, list, dict) makes the
+    frontmatter unusable.
+    """
+    def text(name: str, default: str = '') -> str:
+        value = data.get(name)
+        if value is None:
+            return default
+        if isinstance(value, str):
+            return value
+        # A bool (or list/dict) here means the YAML resolver re-typed
+        # the scalar and its original lexeme is gone; refuse rather
+        # than silently rewriting the field to 'True'/'False'
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise ValueError(f"Frontmatter field {name!r} is not a string")
+        return str(value)
+
+    try:
+        approver = text('approver')
+        return ApprovalRequest(
+            id=text('id'),
+            action_type=text('action_type', 'custom'),  # type: ignore
+            target=text('target'),
+            risk_level=text('risk_level', 'medium'),  # type: ignore
+            rationale=text('rationale'),
+            created_timestamp=(
+                _coerce_timestamp(data.get('created_timestamp'))
+                or datetime.now()
+            ),
+            status=text('status', 'pending'),  # type: ignore
+            approval_timestamp=_coerce_timestamp(data.get('approval_timestamp')),
+            approver=approver if approver and approver != 'null' else None,
+            execution_timestamp=_coerce_timestamp(data.get('execution_timestamp')),
+            source_action_item=text('source_action_item'),
+            mcp_server=text('mcp_server'),
+            mcp_tool=text('mcp_tool')
+        )
+    except (TypeError, ValueError):
+        return None
+
+
 def parse_approval_file(file_path: Path) -> ApprovalRequest | None:
     """
     Parse an approval request file and return an ApprovalRequest object.
@@ -372,16 +623,15 @@ def parse_approval_file(file_path: Path) -> ApprovalRequest | None:
     try:
         content = file_path.read_text(encoding='utf-8')
 
-        # Extract frontmatter
-        frontmatter_match = re.match(
-            r'^---\s*\n(.*?)\n---',
-            content,
-            re.DOTALL
-        )
-        if not frontmatter_match:
+        # Extract frontmatter via string ops (no backtracking regex)
+        if not content.startswith('---'):
+            return None
+        opening, sep, rest = content.partition('\n')
+        if not sep or opening[3:].strip():
+            return None
+        frontmatter, sep, _ = rest.partition('\n---')
+        if not sep:
             return None
-
-        frontmatter = frontmatter_match.group(1)
 
         # Parse YAML-like frontmatter manually (simple parsing)
         def extract_field(name: str, default: str = '') -> str:
@@ -436,3 +686,39 @@ def parse_approval_file(file_path: Path) -> ApprovalRequest | None:
     except (OSError, ValueError) as e:
         print(f"Error parsing approval file: {e}")
         return None
+
+
+def parse_approval_dir(
+    dir_path: Path,
+    workers: int = 8
+) -> Iterator[ApprovalRequest]:
+    """
+    Parse all approval request files in a directory.
+
+    Lists the directory with os.scandir (one syscall batch instead of a
+    stat per file) and reads files on a thread pool, since per-file
+    parsing is I/O-bound.
+
+    Args:
+        dir_path: Directory containing approval request Markdown files.
+        workers: Thread pool size for concurrent file reads.
+
+    Yields:
+        ApprovalRequest objects for each successfully parsed file.
+    """
+    try:
+        with os.scandir(dir_path) as it:
+            entries = [
+                Path(entry.path)
+                for entry in it
+                if entry.is_file() and entry.name.endswith('.md')
+            ]
+    except OSError as e:
+        print(f"Error scanning approval directory: {e}")
+        return
+
+    if not entries:
+        return
+
+    with ThreadPoolExecutor(min(workers, len(entries))) as executor:
+        yield from filter(None, executor.map(parse_approval_file, entries))
@@ -4,46 +4,39 @@ Audit Report Model (Gold Tier)
 Represents a weekly business and accounting audit with cross-domain analysis.
 """
 
+from dataclasses import dataclass, field
 from datetime import date, datetime
 from typing import Optional
-from uuid import uuid4
 
+import orjson
 from pydantic import BaseModel, Field, field_validator
 
+from ._id_pool import new_id
 
-class Anomaly(BaseModel):
-    """Detected anomaly in audit data."""
-    
-    severity: str = Field(
-        ...,
-        description="Anomaly severity",
-        pattern="^(low|medium|high|critical)$"
-    )
-    type: str = Field(
-        ...,
-        description="Anomaly type",
-        pattern="^(financial|social|operational)$"
-    )
-    description: str = Field(..., description="Anomaly description")
-    detected_at: datetime = Field(default_factory=datetime.now, description="When anomaly was detected")
-    
-    @field_validator('severity')
-    @classmethod
-    def validate_severity(cls, v: str) -> str:
-        """Validate severity enum."""
-        valid_severities = ["low", "medium", "high", "critical"]
-        if v not in valid_severities:
-            raise ValueError(f"severity must be one of {valid_severities}")
-        return v
-    
-    @field_validator('type')
-    @classmethod
-    def validate_type(cls, v: str) -> str:
-        """Validate type enum."""
-        valid_types = ["financial", "social", "operational"]
-        if v not in valid_types:
-            raise ValueError(f"type must be one of {valid_types}")
-        return v
+
+_VALID_SEVERITIES = frozenset({"low", "medium", "high", "critical"})
+_VALID_TYPES = frozenset({"financial", "social", "operational"})
+
+
+@dataclass(slots=True)
+class Anomaly:
+    """Detected anomaly in audit data.
+
+    A slotted dataclass rather than a Pydantic model: audits can emit
+    many of these and validation is two set-membership checks.
+    """
+
+    severity: str  # Anomaly severity
+    type: str  # Anomaly type
+    description: str  # Anomaly description
+    detected_at: datetime = field(default_factory=datetime.now)  # When detected
+
+    def __post_init__(self) -> None:
+        """Validate enum fields in a single pass."""
+        if self.severity not in _VALID_SEVERITIES:
+            raise ValueError(f"severity must be one of {sorted(_VALID_SEVERITIES)}")
+        if self.type not in _VALID_TYPES:
+            raise ValueError(f"type must be one of {sorted(_VALID_TYPES)}")
 
 
 class AuditReport(BaseModel):
@@ -53,7 +46,7 @@ class AuditReport(BaseModel):
     File Location: /Accounting/Audits/<YYYY-MM-DD>-audit-report.json
     """
     
-    id: str = Field(default_factory=lambda: str(uuid4()), description="Unique identifier")
+    id: str = Field(default_factory=new_id, description="Unique identifier")
     generated_at: datetime = Field(default_factory=datetime.now, description="Audit generation timestamp")
     period_start: date = Field(..., description="Audit period start")
     period_end: date = Field(..., description="Audit period end")
@@ -87,16 +80,10 @@ class AuditReport(BaseModel):
         if period_start and v < period_start:
             raise ValueError("period_end must be after period_start")
         return v
-    
-    @field_validator('status')
-    @classmethod
-    def validate_status(cls, v: str) -> str:
-        """Validate status enum."""
-        valid_statuses = ["complete", "partial", "failed"]
-        if v not in valid_statuses:
-            raise ValueError(f"status must be one of {valid_statuses}")
-        return v
-    
+
+    # status enum membership is enforced by the Field pattern above;
+    # no validator needed.
+
     def calculate_success_rate(self) -> float:
         """Calculate success rate from action_logs_summary."""
         if 'success_rate' in self.action_logs_summary:
@@ -116,13 +103,14 @@ class AuditReport(BaseModel):
     
     def model_dump_json(self, **kwargs) -> str:
         """Serialize to JSON string."""
-        from json import dumps
-        return dumps(self.model_dump(**kwargs), default=str, indent=2)
-    
+        return orjson.dumps(
+            self.model_dump(**kwargs),
+            option=orjson.OPT_INDENT_2,
+            default=str,
+        ).decode()
+
     @classmethod
     def model_validate_json(cls, json_data: str | bytes) -> "AuditReport":
         """Deserialize from JSON string."""
-        from json import loads
-        data = loads(json_data) if isinstance(json_data, bytes) else loads(json_data)
-        return cls.model_validate(data)
+        return cls.model_validate(orjson.loads(json_data))
 
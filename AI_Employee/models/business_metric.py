@@ -7,101 +7,111 @@ Tracks specific business KPIs over time with trend calculation.
 from __future__ import annotations
 
 import datetime as dt
-from typing import Optional
-from uuid import uuid4
+from dataclasses import asdict, dataclass, field
 
-from pydantic import BaseModel, Field, field_validator
+import orjson
 
+from ._id_pool import new_id
 
-class BusinessMetric(BaseModel):
+
+_VALID_SOURCES = frozenset({"xero", "facebook", "instagram", "twitter", "manual"})
+_VALID_CATEGORIES = frozenset({"financial", "social", "operational", "growth"})
+_VALID_TRENDS = frozenset({"up", "down", "stable"})
+
+# Indexed by (change > 5) - (change < -5) + 1 for branchless trend lookup
+_TRENDS = ("down", "stable", "up")
+
+
+@dataclass(slots=True)
+class BusinessMetric:
     """
     Business Metric entity for Gold Tier.
-    
+
     File Location: /Business/Metrics/<YYYY-MM-DD>-<metric-name>.json
+
+    Implemented as a slotted dataclass instead of a Pydantic model:
+    metric timeseries construct many trivial instances, and the enum
+    checks are plain set-membership tests done once in __post_init__.
     """
-    
-    id: str = Field(default_factory=lambda: str(uuid4()), description="Unique identifier")
-    metric_name: str = Field(..., description="Metric name (e.g., 'monthly_revenue', 'social_engagement')")
-    date: dt.date = Field(..., description="Metric date")
-    value: float = Field(..., description="Metric value")
-    unit: str = Field(default="", description="Metric unit (USD, percentage, count, etc.)")
-    source: str = Field(
-        default="manual",
-        description="Data source",
-        pattern="^(xero|facebook|instagram|twitter|manual)$"
-    )
-    category: str = Field(
-        default="operational",
-        description="Metric category",
-        pattern="^(financial|social|operational|growth)$"
-    )
-    trend: str = Field(
-        default="stable",
-        description="Trend direction",
-        pattern="^(up|down|stable)$"
-    )
-    change_percentage: float = Field(default=0.0, description="Percentage change from previous period")
-    target_value: float | None = Field(default=None, description="Target value if applicable")
-    metadata: dict = Field(default_factory=dict, description="Additional context")
-    created_at: dt.datetime = Field(default_factory=dt.datetime.now, description="Metric creation timestamp")
-    
-    @field_validator('source')
-    @classmethod
-    def validate_source(cls, v: str) -> str:
-        """Validate source enum."""
-        valid_sources = ["xero", "facebook", "instagram", "twitter", "manual"]
-        if v not in valid_sources:
-            raise ValueError(f"source must be one of {valid_sources}")
-        return v
-    
-    @field_validator('category')
-    @classmethod
-    def validate_category(cls, v: str) -> str:
-        """Validate category enum."""
-        valid_categories = ["financial", "social", "operational", "growth"]
-        if v not in valid_categories:
-            raise ValueError(f"category must be one of {valid_categories}")
-        return v
-    
-    @field_validator('trend')
-    @classmethod
-    def validate_trend(cls, v: str) -> str:
-        """Validate trend enum."""
-        valid_trends = ["up", "down", "stable"]
-        if v not in valid_trends:
-            raise ValueError(f"trend must be one of {valid_trends}")
-        return v
-    
+
+    metric_name: str  # Metric name (e.g., 'monthly_revenue', 'social_engagement')
+    date: dt.date  # Metric date
+    value: float  # Metric value
+    id: str = field(default_factory=new_id)  # Unique identifier
+    unit: str = ""  # Metric unit (USD, percentage, count, etc.)
+    source: str = "manual"  # Data source
+    category: str = "operational"  # Metric category
+    trend: str = "stable"  # Trend direction
+    change_percentage: float = 0.0  # Percentage change from previous period
+    target_value: float | None = None  # Target value if applicable
+    metadata: dict = field(default_factory=dict)  # Additional context
+    created_at: dt.datetime = field(default_factory=dt.datetime.now)  # Creation timestamp
+
+    def __post_init__(self) -> None:
+        """Validate enum fields in a single pass."""
+        if self.source not in _VALID_SOURCES:
+            raise ValueError(f"source must be one of {sorted(_VALID_SOURCES)}")
+        if self.category not in _VALID_CATEGORIES:
+            raise ValueError(f"category must be one of {sorted(_VALID_CATEGORIES)}")
+        if self.trend not in _VALID_TRENDS:
+            raise ValueError(f"trend must be one of {sorted(_VALID_TRENDS)}")
+
     def calculate_trend(self, previous_value: float | None) -> tuple[str, float]:
         """
         Calculate trend and change percentage from previous value.
-        
+
         Returns:
             Tuple of (trend, change_percentage)
         """
         if previous_value is None or previous_value == 0:
             return ("stable", 0.0)
-        
+
         change = ((self.value - previous_value) / previous_value) * 100.0
-        
-        if change > 5.0:
-            trend = "up"
-        elif change < -5.0:
-            trend = "down"
-        else:
-            trend = "stable"
-        
-        return (trend, change)
-    
+        return (_TRENDS[(change > 5.0) - (change < -5.0) + 1], change)
+
+    def model_dump(self) -> dict:
+        """Return a dict representation (Pydantic-compatible name)."""
+        return asdict(self)
+
     def model_dump_json(self, **kwargs) -> str:
         """Serialize to JSON string."""
-        from json import dumps
-        return dumps(self.model_dump(**kwargs), default=str, indent=2)
-    
+        return orjson.dumps(asdict(self), option=orjson.OPT_INDENT_2).decode()
+
     @classmethod
     def model_validate_json(cls, json_data: str | bytes) -> "BusinessMetric":
         """Deserialize from JSON string."""
-        from json import loads
-        data = loads(json_data) if isinstance(json_data, bytes) else loads(json_data)
-        return cls.model_validate(data)
+        data = orjson.loads(json_data)
+        if isinstance(data.get('date'), str):
+            data['date'] = dt.date.fromisoformat(data['date'])
+        if isinstance(data.get('created_at'), str):
+            data['created_at'] = dt.datetime.fromisoformat(data['created_at'])
+        return cls(**data)
+
 
+def calculate_trend_batch(values) -> tuple["np.ndarray", "np.ndarray"]:
+    """
+    Calculate trends and change percentages across a metric timeseries.
+
+    Vectorized companion to BusinessMetric.calculate_trend for dashboard
+    scans: one NumPy pass instead of a Python branch per point.
+
+    Args:
+        values: Sequence of consecutive metric values (length >= 2).
+
+    Returns:
+        Tuple of (trends, changes) arrays of length len(values) - 1,
+        where points following a zero value are marked 'stable' with
+        0.0 change, matching the per-instance method.
+    """
+    import numpy as np
+
+    values = np.asarray(values, dtype=np.float64)
+    previous = values[:-1]
+    nonzero = previous != 0
+    changes = np.zeros(len(previous), dtype=np.float64)
+    np.divide(values[1:] - previous, previous, where=nonzero, out=changes)
+    changes *= 100.0
+    trends = np.where(
+        changes > 5.0, 'up', np.where(changes < -5.0, 'down', 'stable')
+    )
+    return trends, changes
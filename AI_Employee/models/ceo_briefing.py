@@ -4,28 +4,43 @@ CEO Briefing Model (Gold Tier)
 Represents a weekly executive summary with AI-generated insights.
 """
 
+import re
 from datetime import date, datetime
+from io import StringIO
 from typing import Optional
-from uuid import uuid4
 
 from pydantic import BaseModel, Field, field_validator
 
+from ._id_pool import new_id
+
+
+# Word-run pattern for counting without allocating a split() list
+_WORD_RE = re.compile(r'\S+')
+
+# Static to_markdown segments, built once; each write is a single memcpy
+_SEC_EXEC = "## Executive Summary\n\n"
+_SEC_INSIGHTS = "\n\n## Key Insights\n\n"
+_SEC_FIN = (
+    "\n\n## Financial Summary\n\n"
+    "See attached financial summary for details."
+)
+_SEC_SOCIAL = (
+    "\n\n## Social Media Performance\n\n"
+    "See attached social media engagement summary for details."
+)
+_SEC_GOALS = "\n\n## Goal Progress\n\n"
+_SEC_RISKS = "\n\n## Risks and Alerts\n\n"
+_SEC_RECS = "\n\n## Recommendations\n\n"
+_SEC_ATTACH = "\n\n## Attachments\n\n"
+
 
 class GoalProgress(BaseModel):
     """Business goal progress information."""
     
     goal_id: str = Field(..., description="Business goal ID")
     goal_title: str = Field(..., description="Goal title")
-    completion_percentage: float = Field(..., description="Completion percentage (0.0-100.0)")
+    completion_percentage: float = Field(..., ge=0.0, le=100.0, description="Completion percentage (0.0-100.0)")
     status: str = Field(..., description="Goal status")
-    
-    @field_validator('completion_percentage')
-    @classmethod
-    def validate_percentage(cls, v: float) -> float:
-        """Ensure completion_percentage is between 0 and 100."""
-        if not 0.0 <= v <= 100.0:
-            raise ValueError("completion_percentage must be between 0.0 and 100.0")
-        return v
 
 
 class CEOBriefing(BaseModel):
@@ -35,7 +50,7 @@ class CEOBriefing(BaseModel):
     File Location: /Briefings/<YYYY-MM-DD>-ceo-briefing.md
     """
     
-    id: str = Field(default_factory=lambda: str(uuid4()), description="Unique identifier")
+    id: str = Field(default_factory=new_id, description="Unique identifier")
     generated_at: datetime = Field(default_factory=datetime.now, description="Briefing generation timestamp")
     period_start: date = Field(..., description="Reporting period start (Monday)")
     period_end: date = Field(..., description="Reporting period end (Sunday)")
@@ -56,120 +71,80 @@ class CEOBriefing(BaseModel):
     @classmethod
     def validate_period_start(cls, v: date) -> date:
         """Ensure period_start is a Monday."""
-        if v.weekday() != 0:  # Monday is 0
+        # Ordinal 1 is Monday 1 Jan AD 1, so Monday iff ordinal % 7 == 1;
+        # skips the weekday() method call on this per-briefing path
+        if v.toordinal() % 7 != 1:
             raise ValueError("period_start must be a Monday")
         return v
-    
+
     @field_validator('period_end')
     @classmethod
     def validate_period_end(cls, v: date, info) -> date:
         """Ensure period_end is a Sunday and after period_start."""
-        if v.weekday() != 6:  # Sunday is 6
+        end_ordinal = v.toordinal()
+        if end_ordinal % 7 != 0:  # Sunday iff ordinal % 7 == 0
             raise ValueError("period_end must be a Sunday")
-        
+
         period_start = info.data.get('period_start')
-        if period_start and v < period_start:
+        if period_start and end_ordinal < period_start.toordinal():
             raise ValueError("period_end must be after period_start")
         return v
     
-    @field_validator('key_insights')
-    @classmethod
-    def validate_key_insights(cls, v: list[str]) -> list[str]:
-        """Ensure key_insights has 3-5 items."""
-        if not 3 <= len(v) <= 5:
-            raise ValueError("key_insights must have 3-5 items")
-        return v
-    
     @field_validator('executive_summary')
     @classmethod
     def validate_executive_summary_length(cls, v: str) -> str:
         """Ensure executive_summary is 200-300 words."""
-        word_count = len(v.split())
+        word_count = sum(1 for _ in _WORD_RE.finditer(v))
         if not 200 <= word_count <= 300:
             raise ValueError(f"executive_summary must be 200-300 words (got {word_count})")
         return v
     
     def model_dump_json(self, **kwargs) -> str:
-        """Serialize to JSON string."""
-        from json import dumps
-        return dumps(self.model_dump(**kwargs), default=str, indent=2)
-    
-    @classmethod
-    def model_validate_json(cls, json_data: str | bytes) -> "CEOBriefing":
-        """Deserialize from JSON string."""
-        from json import loads
-        data = loads(json_data) if isinstance(json_data, bytes) else loads(json_data)
-        return cls.model_validate(data)
+        """Serialize to JSON string (pydantic-core native path)."""
+        kwargs.setdefault('indent', 2)
+        return super().model_dump_json(**kwargs)
     
     def to_markdown(self) -> str:
         """Convert CEO Briefing to Markdown format for file storage."""
-        lines = [
-            f"# CEO Briefing - {self.period_start} to {self.period_end}",
-            "",
-            f"**Generated:** {self.generated_at.strftime('%Y-%m-%d %H:%M:%S')}",
-            "",
-            "## Executive Summary",
-            "",
-            self.executive_summary,
-            "",
-            "## Key Insights",
-            ""
-        ]
-        
-        for i, insight in enumerate(self.key_insights, 1):
-            lines.append(f"{i}. {insight}")
-        
+        buf = StringIO()
+        w = buf.write
+
+        w(f"# CEO Briefing - {self.period_start} to {self.period_end}\n\n")
+        w(f"**Generated:** {self.generated_at.isoformat(sep=' ', timespec='seconds')}\n\n")
+        w(_SEC_EXEC)
+        w(self.executive_summary)
+        w(_SEC_INSIGHTS)
+        w("\n".join(
+            f"{i}. {insight}" for i, insight in enumerate(self.key_insights, 1)
+        ))
+
         if self.financial_summary:
-            lines.extend([
-                "",
-                "## Financial Summary",
-                "",
-                f"See attached financial summary for details."
-            ])
-        
+            w(_SEC_FIN)
+
         if self.social_media_summary:
-            lines.extend([
-                "",
-                "## Social Media Performance",
-                "",
-                f"See attached social media engagement summary for details."
-            ])
-        
+            w(_SEC_SOCIAL)
+
         if self.goal_progress:
-            lines.extend([
-                "",
-                "## Goal Progress",
-                ""
-            ])
-            for goal in self.goal_progress:
-                lines.append(f"- **{goal.goal_title}**: {goal.completion_percentage:.1f}% complete ({goal.status})")
-        
+            w(_SEC_GOALS)
+            w("\n".join(
+                f"- **{goal.goal_title}**: {goal.completion_percentage:.1f}%"
+                f" complete ({goal.status})"
+                for goal in self.goal_progress
+            ))
+
         if self.risks_and_alerts:
-            lines.extend([
-                "",
-                "## Risks and Alerts",
-                ""
-            ])
-            for risk in self.risks_and_alerts:
-                lines.append(f"- ⚠️ {risk}")
-        
+            w(_SEC_RISKS)
+            w("\n".join(f"- ⚠️ {risk}" for risk in self.risks_and_alerts))
+
         if self.recommendations:
-            lines.extend([
-                "",
-                "## Recommendations",
-                ""
-            ])
-            for i, rec in enumerate(self.recommendations, 1):
-                lines.append(f"{i}. {rec}")
-        
+            w(_SEC_RECS)
+            w("\n".join(
+                f"{i}. {rec}" for i, rec in enumerate(self.recommendations, 1)
+            ))
+
         if self.attachments:
-            lines.extend([
-                "",
-                "## Attachments",
-                ""
-            ])
-            for attachment in self.attachments:
-                lines.append(f"- {attachment}")
-        
-        return "\n".join(lines)
+            w(_SEC_ATTACH)
+            w("\n".join(f"- {attachment}" for attachment in self.attachments))
+
+        return buf.getvalue()
 
@@ -6,27 +6,29 @@ Represents a workflow spanning Personal and Business domains.
 
 from datetime import datetime
 from typing import Optional
-from uuid import uuid4
 
 from pydantic import BaseModel, Field, field_validator
 
+from ._id_pool import new_id
+
+
+_VALID_DOMAINS = frozenset(("personal", "business", "accounting", "social_media"))
+_VALID_SOURCE_DOMAINS = frozenset(("personal", "business"))
+_VALID_STATUSES = frozenset(
+    ("pending", "in_progress", "completed", "failed", "cancelled")
+)
+_VALID_STEP_STATUSES = frozenset(("pending", "in_progress", "completed", "failed"))
+_PENDING_OR_RUNNING = frozenset(("pending", "in_progress"))
+
 
 class WorkflowStep(BaseModel):
     """A single step in a cross-domain workflow."""
     
     step_number: int = Field(..., description="Step sequence number")
     description: str = Field(..., description="Step description")
-    domain: str = Field(
-        ...,
-        description="Domain for this step",
-        pattern="^(personal|business|accounting|social_media)$"
-    )
+    domain: str = Field(..., description="Domain for this step")
     action_type: str = Field(..., description="Type of action (e.g., 'email', 'xero_expense', 'social_post')")
-    status: str = Field(
-        default="pending",
-        description="Step status",
-        pattern="^(pending|in_progress|completed|failed)$"
-    )
+    status: str = Field(default="pending", description="Step status")
     mcp_server: Optional[str] = Field(default=None, description="MCP server used for this step")
     result: Optional[dict] = Field(default=None, description="Step execution result")
     error: Optional[str] = Field(default=None, description="Error message if step failed")
@@ -40,6 +42,22 @@ class WorkflowStep(BaseModel):
             raise ValueError("step_number must be >= 1")
         return v
 
+    @field_validator('domain')
+    @classmethod
+    def validate_domain(cls, v: str) -> str:
+        """Validate domain enum."""
+        if v not in _VALID_DOMAINS:
+            raise ValueError(f"domain must be one of {sorted(_VALID_DOMAINS)}")
+        return v
+
+    @field_validator('status')
+    @classmethod
+    def validate_status(cls, v: str) -> str:
+        """Validate status enum."""
+        if v not in _VALID_STEP_STATUSES:
+            raise ValueError(f"status must be one of {sorted(_VALID_STEP_STATUSES)}")
+        return v
+
 
 class CrossDomainWorkflow(BaseModel):
     """
@@ -48,72 +66,64 @@ class CrossDomainWorkflow(BaseModel):
     File Location: /Business/Workflows/<workflow-id>.json
     """
     
-    id: str = Field(default_factory=lambda: str(uuid4()), description="Unique identifier")
+    id: str = Field(default_factory=new_id, description="Unique identifier")
     created_at: datetime = Field(default_factory=datetime.now, description="Workflow creation timestamp")
     title: str = Field(..., min_length=1, max_length=200, description="Workflow title")
     description: str = Field(default="", description="Workflow description")
-    source_domain: str = Field(
-        ...,
-        description="Domain where workflow originated",
-        pattern="^(personal|business)$"
-    )
-    target_domain: str = Field(
-        ...,
-        description="Domain where workflow completes",
-        pattern="^(personal|business|accounting|social_media)$"
-    )
+    source_domain: str = Field(..., description="Domain where workflow originated")
+    target_domain: str = Field(..., description="Domain where workflow completes")
     steps: list[WorkflowStep] = Field(..., min_length=1, description="Ordered list of workflow steps")
-    status: str = Field(
-        default="pending",
-        description="Overall workflow status",
-        pattern="^(pending|in_progress|completed|failed|cancelled)$"
-    )
+    status: str = Field(default="pending", description="Overall workflow status")
     trigger_action_id: str = Field(..., description="Action item ID that triggered this workflow")
     related_approval_ids: list[str] = Field(default_factory=list, description="Approval request IDs")
     metadata: dict = Field(default_factory=dict, description="Additional workflow metadata")
     
-    @field_validator('source_domain', 'target_domain')
+    @field_validator('source_domain')
+    @classmethod
+    def validate_source_domain(cls, v: str) -> str:
+        """Validate source domain enum (workflows originate personal/business)."""
+        if v not in _VALID_SOURCE_DOMAINS:
+            raise ValueError(
+                f"source_domain must be one of {sorted(_VALID_SOURCE_DOMAINS)}"
+            )
+        return v
+
+    @field_validator('target_domain')
     @classmethod
     def validate_domains(cls, v: str) -> str:
         """Validate domain enum."""
-        valid_domains = ["personal", "business", "accounting", "social_media"]
-        if v not in valid_domains:
-            raise ValueError(f"domain must be one of {valid_domains}")
+        if v not in _VALID_DOMAINS:
+            raise ValueError(f"domain must be one of {sorted(_VALID_DOMAINS)}")
         return v
-    
+
     @field_validator('status')
     @classmethod
     def validate_status(cls, v: str) -> str:
         """Validate status enum."""
-        valid_statuses = ["pending", "in_progress", "completed", "failed", "cancelled"]
-        if v not in valid_statuses:
-            raise ValueError(f"status must be one of {valid_statuses}")
+        if v not in _VALID_STATUSES:
+            raise ValueError(f"status must be one of {sorted(_VALID_STATUSES)}")
         return v
     
     def get_current_step(self) -> Optional[WorkflowStep]:
         """Get the current step being executed."""
-        for step in self.steps:
-            if step.status in ["pending", "in_progress"]:
-                return step
-        return None
-    
+        return next(
+            (s for s in self.steps if s.status in _PENDING_OR_RUNNING), None
+        )
+
     def calculate_completion_percentage(self) -> float:
         """Calculate workflow completion percentage."""
-        if not self.steps:
+        steps = self.steps
+        if not steps:
             return 0.0
-        
-        completed_steps = sum(1 for step in self.steps if step.status == "completed")
-        return (completed_steps / len(self.steps)) * 100.0
+
+        completed = 0
+        for step in steps:
+            if step.status == "completed":
+                completed += 1
+        return completed * (100.0 / len(steps))
     
     def model_dump_json(self, **kwargs) -> str:
-        """Serialize to JSON string."""
-        from json import dumps
-        return dumps(self.model_dump(**kwargs), default=str, indent=2)
-    
-    @classmethod
-    def model_validate_json(cls, json_data: str | bytes) -> "CrossDomainWorkflow":
-        """Deserialize from JSON string."""
-        from json import loads
-        data = loads(json_data) if isinstance(json_data, bytes) else loads(json_data)
-        return cls.model_validate(data)
+        """Serialize to JSON string (pydantic-core native path)."""
+        kwargs.setdefault('indent', 2)
+        return super().model_dump_json(**kwargs)
 
@@ -5,16 +5,28 @@ Defines the MCPServer dataclass for tracking MCP server metadata,
 status, and capabilities.
 """
 
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
+from types import MappingProxyType
 from typing import Any, Literal
 
 
 ServerType = Literal['email', 'linkedin', 'playwright', 'custom']
 ServerStatus = Literal['available', 'error', 'offline', 'unknown']
 
+# Frozen status -> emoji map, built once instead of per dashboard refresh
+_STATUS_EMOJIS = MappingProxyType({
+    'available': '✅',  # Green check
+    'error': '❌',       # Red X
+    'offline': '⚪',     # White circle
+    'unknown': '❔'      # Question mark
+})
 
-@dataclass
+# Bound once so hot status updates skip the module attribute lookup
+_now = datetime.now
+
+
+@dataclass(slots=True, eq=False)
 class MCPServer:
     """
     Represents an MCP server for external action execution.
@@ -72,7 +84,7 @@ class MCPServer:
 
         Updates last_successful_action timestamp and resets error_count.
         """
-        self.last_successful_action = datetime.now()
+        self.last_successful_action = _now()
         self.error_count = 0
         self.status = 'available'
 
@@ -96,7 +108,7 @@ class MCPServer:
         Args:
             is_healthy: Whether the health check passed.
         """
-        self.last_health_check = datetime.now()
+        self.last_health_check = _now()
         if is_healthy:
             self.status = 'available'
         else:
@@ -121,25 +133,12 @@ class MCPServer:
         Returns:
             Dictionary representation of the MCP server.
         """
-        return {
-            'server_name': self.server_name,
-            'server_type': self.server_type,
-            'status': self.status,
-            'command': self.command,
-            'transport': self.transport,
-            'capabilities': self.capabilities,
-            'last_successful_action': (
-                self.last_successful_action.isoformat()
-                if self.last_successful_action else None
-            ),
-            'last_health_check': (
-                self.last_health_check.isoformat()
-                if self.last_health_check else None
-            ),
-            'error_count': self.error_count,
-            'environment': self.environment,
-            'config': self.config
-        }
+        data = asdict(self)
+        if data['last_successful_action']:
+            data['last_successful_action'] = self.last_successful_action.isoformat()
+        if data['last_health_check']:
+            data['last_health_check'] = self.last_health_check.isoformat()
+        return data
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> 'MCPServer':
@@ -157,11 +156,6 @@ class MCPServer:
 
         return cls(
             server_name=data.get('server_name', ''),
-            server_type=data.get('server_type', 'custom'),
-            status=data.get('status', 'unknown'),
-            command=data.get('command', ''),
-            transport=data.get('transport', 'stdio'),
-            capabilities=data.get('capabilities', []),
             last_successful_action=(
                 datetime.fromisoformat(last_action)
                 if last_action else None
@@ -170,9 +164,14 @@ class MCPServer:
                 datetime.fromisoformat(last_check)
                 if last_check else None
             ),
-            error_count=data.get('error_count', 0),
-            environment=data.get('environment', {}),
-            config=data.get('config', {})
+            **{
+                name: data[name]
+                for name in (
+                    'server_type', 'status', 'command', 'transport',
+                    'capabilities', 'error_count', 'environment', 'config'
+                )
+                if name in data
+            }
         )
 
     def get_status_emoji(self) -> str:
@@ -182,13 +181,7 @@ class MCPServer:
         Returns:
             Emoji representing the current status.
         """
-        status_emojis = {
-            'available': '\u2705',  # Green check
-            'error': '\u274c',       # Red X
-            'offline': '\u26aa',     # White circle
-            'unknown': '\u2754'      # Question mark
-        }
-        return status_emojis.get(self.status, '\u2754')
+        return _STATUS_EMOJIS.get(self.status, '\u2754')
 
     def get_health_summary(self) -> str:
         """
@@ -197,9 +190,11 @@ class MCPServer:
         Returns:
             Summary string for dashboard display.
         """
-        emoji = self.get_status_emoji()
-        last_action = 'Never'
-        if self.last_successful_action:
-            last_action = self.last_successful_action.strftime('%Y-%m-%d %H:%M')
+        emoji = _STATUS_EMOJIS.get(self.status, '❔')
+        last = self.last_successful_action
+        # isoformat's C fast path; same output as '%Y-%m-%d %H:%M'
+        last_action = (
+            last.isoformat(sep=' ', timespec='minutes') if last else 'Never'
+        )
 
         return f"{emoji} {self.status} | Last success: {last_action} | Errors: {self.error_count}"
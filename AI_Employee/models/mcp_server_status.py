@@ -6,10 +6,18 @@ Represents health and status information for an MCP server.
 
 from datetime import datetime
 from typing import Optional
-from uuid import uuid4
 
+import msgspec
 from pydantic import BaseModel, Field, field_validator
 
+from ._id_pool import new_id
+
+
+_VALID_MCP_STATUSES = frozenset(("healthy", "degraded", "down", "unknown"))
+
+# Bound once so hot status updates skip the module attribute lookup
+_now = datetime.now
+
 
 class MCPServerStatus(BaseModel):
     """
@@ -18,13 +26,9 @@ class MCPServerStatus(BaseModel):
     File Location: /System/MCP_Status/<server-name>.json
     """
     
-    id: str = Field(default_factory=lambda: str(uuid4()), description="Unique identifier")
+    id: str = Field(default_factory=new_id, description="Unique identifier")
     server_name: str = Field(..., description="MCP server name (e.g., 'xero-mcp', 'facebook-mcp')")
-    status: str = Field(
-        default="unknown",
-        description="Server health status",
-        pattern="^(healthy|degraded|down|unknown)$"
-    )
+    status: str = Field(default="unknown", description="Server health status")
     last_successful_request: Optional[datetime] = Field(
         default=None,
         description="Timestamp of last successful request"
@@ -33,11 +37,11 @@ class MCPServerStatus(BaseModel):
         default=None,
         description="Timestamp of last failed request"
     )
-    consecutive_failures: int = Field(default=0, description="Number of consecutive failures")
-    total_requests: int = Field(default=0, description="Total number of requests made")
-    successful_requests: int = Field(default=0, description="Number of successful requests")
-    failed_requests: int = Field(default=0, description="Number of failed requests")
-    average_response_time_ms: float = Field(default=0.0, description="Average response time in milliseconds")
+    consecutive_failures: int = Field(default=0, ge=0, description="Number of consecutive failures")
+    total_requests: int = Field(default=0, ge=0, description="Total number of requests made")
+    successful_requests: int = Field(default=0, ge=0, description="Number of successful requests")
+    failed_requests: int = Field(default=0, ge=0, description="Number of failed requests")
+    average_response_time_ms: float = Field(default=0.0, ge=0.0, description="Average response time in milliseconds")
     last_error: Optional[str] = Field(default=None, description="Last error message")
     rate_limit_remaining: Optional[int] = Field(default=None, description="Remaining rate limit quota")
     rate_limit_reset_at: Optional[datetime] = Field(default=None, description="When rate limit resets")
@@ -47,27 +51,13 @@ class MCPServerStatus(BaseModel):
     @classmethod
     def validate_status(cls, v: str) -> str:
         """Validate status enum."""
-        valid_statuses = ["healthy", "degraded", "down", "unknown"]
-        if v not in valid_statuses:
-            raise ValueError(f"status must be one of {valid_statuses}")
-        return v
-    
-    @field_validator('consecutive_failures', 'total_requests', 'successful_requests', 'failed_requests')
-    @classmethod
-    def validate_non_negative(cls, v: int) -> int:
-        """Ensure counts are non-negative."""
-        if v < 0:
-            raise ValueError("Counts must be non-negative")
-        return v
-    
-    @field_validator('average_response_time_ms')
-    @classmethod
-    def validate_response_time(cls, v: float) -> float:
-        """Ensure response time is non-negative."""
-        if v < 0:
-            raise ValueError("average_response_time_ms must be non-negative")
+        if v not in _VALID_MCP_STATUSES:
+            raise ValueError(f"status must be one of {sorted(_VALID_MCP_STATUSES)}")
         return v
     
+    # Count and response-time non-negativity is enforced by Field(ge=0)
+    # natively in pydantic-core; no Python validators needed.
+
     def calculate_success_rate(self) -> float:
         """Calculate success rate percentage."""
         if self.total_requests == 0:
@@ -76,12 +66,13 @@ class MCPServerStatus(BaseModel):
     
     def update_status(self, success: bool, response_time_ms: float = 0.0, error: Optional[str] = None) -> None:
         """Update status based on request result."""
+        now = _now()
         self.total_requests += 1
-        self.updated_at = datetime.now()
+        self.updated_at = now
         
         if success:
             self.successful_requests += 1
-            self.last_successful_request = datetime.now()
+            self.last_successful_request = now
             self.consecutive_failures = 0
             
             # Update average response time
@@ -94,17 +85,19 @@ class MCPServerStatus(BaseModel):
                     alpha * response_time_ms + (1 - alpha) * self.average_response_time_ms
                 )
             
-            # Determine status based on success rate
-            success_rate = self.calculate_success_rate()
-            if success_rate >= 95.0:
+            # Determine status based on success rate; integer cross-
+            # multiplication (rate >= 95% iff s*20 >= t*19) avoids the
+            # float division, and total_requests > 0 is guaranteed here
+            s, t = self.successful_requests, self.total_requests
+            if s * 20 >= t * 19:
                 self.status = "healthy"
-            elif success_rate >= 80.0:
+            elif s * 5 >= t * 4:
                 self.status = "degraded"
             else:
                 self.status = "down"
         else:
             self.failed_requests += 1
-            self.last_failed_request = datetime.now()
+            self.last_failed_request = now
             self.consecutive_failures += 1
             self.last_error = error
             
@@ -119,14 +112,49 @@ class MCPServerStatus(BaseModel):
                     self.status = "degraded"
     
     def model_dump_json(self, **kwargs) -> str:
-        """Serialize to JSON string."""
-        from json import dumps
-        return dumps(self.model_dump(**kwargs), default=str, indent=2)
-    
-    @classmethod
-    def model_validate_json(cls, json_data: str | bytes) -> "MCPServerStatus":
-        """Deserialize from JSON string."""
-        from json import loads
-        data = loads(json_data) if isinstance(json_data, bytes) else loads(json_data)
-        return cls.model_validate(data)
+        """Serialize to JSON string (pydantic-core native path)."""
+        kwargs.setdefault('indent', 2)
+        return super().model_dump_json(**kwargs)
+
+
+class MCPServerStatusFast(msgspec.Struct):
+    """
+    msgspec twin of MCPServerStatus for the per-update disk path.
+
+    Status files are rewritten on every health check, so the storage
+    codec skips Pydantic validation entirely; the Pydantic model stays
+    the API boundary and the bridge functions below convert between
+    the two.
+    """
+
+    server_name: str
+    id: str = msgspec.field(default_factory=new_id)
+    status: str = "unknown"
+    last_successful_request: Optional[datetime] = None
+    last_failed_request: Optional[datetime] = None
+    consecutive_failures: int = 0
+    total_requests: int = 0
+    successful_requests: int = 0
+    failed_requests: int = 0
+    average_response_time_ms: float = 0.0
+    last_error: Optional[str] = None
+    rate_limit_remaining: Optional[int] = None
+    rate_limit_reset_at: Optional[datetime] = None
+    updated_at: datetime = msgspec.field(default_factory=datetime.now)
+
+
+# Per-schema codec generated once at import; both are C-level fast paths
+_STATUS_ENCODER = msgspec.json.Encoder()
+_STATUS_DECODER = msgspec.json.Decoder(MCPServerStatusFast)
+
+
+def dump_status_bytes(status: MCPServerStatus) -> bytes:
+    """Encode a status model straight to JSON bytes via msgspec."""
+    return _STATUS_ENCODER.encode(MCPServerStatusFast(**dict(status)))
+
+
+def load_status_bytes(raw: bytes) -> MCPServerStatus:
+    """Decode JSON bytes from a status file into the Pydantic model."""
+    record = _STATUS_DECODER.decode(raw)
+    return MCPServerStatus.model_validate(msgspec.structs.asdict(record))
 
@@ -10,12 +10,75 @@ to detect when the same event is reported from multiple sources.
 
 import hashlib
 import json
+import math
+import os
 from pathlib import Path
 from typing import Literal
 
+import orjson
+
 
 SourceType = Literal['gmail', 'file', 'whatsapp', 'linkedin']
 
+# Replay log entries before the snapshot is rewritten and the log truncated
+_COMPACT_THRESHOLD = 10_000
+
+# Bound on the per-item content-hash memo cache
+_HASH_CACHE_SIZE = 10_000
+
+
+class _BloomFilter:
+    """
+    Bytes-backed Bloom filter fronting negative is_processed lookups.
+
+    Uses double hashing from the two halves of a SHA-256 digest; sized
+    with the standard m = 1.44 * n * log2(1/eps) bits, k = log2(1/eps)
+    hashes. May report false positives (resolved against the real set)
+    but never false negatives.
+    """
+
+    __slots__ = ('_bits', '_m', '_k')
+
+    def __init__(
+        self,
+        expected_items: int = 1_000_000,
+        error_rate: float = 0.001,
+        bits: bytearray | None = None
+    ):
+        self._k = max(1, round(math.log2(1 / error_rate)))
+        m = math.ceil(1.44 * expected_items * math.log2(1 / error_rate))
+        self._m = (m + 7) & ~7  # Round up to a whole byte
+        self._bits = bits if bits is not None else bytearray(self._m // 8)
+
+    def _indices(self, key: str):
+        digest = hashlib.sha256(key.encode('utf-8')).digest()
+        h1 = int.from_bytes(digest[:8], 'big')
+        h2 = int.from_bytes(digest[8:16], 'big') | 1
+        m = self._m
+        return ((h1 + i * h2) % m for i in range(self._k))
+
+    def add(self, key: str) -> None:
+        bits = self._bits
+        for idx in self._indices(key):
+            bits[idx >> 3] |= 1 << (idx & 7)
+
+    def __contains__(self, key: str) -> bool:
+        bits = self._bits
+        for idx in self._indices(key):
+            if not bits[idx >> 3] & (1 << (idx & 7)):
+                return False
+        return True
+
+    def clear(self) -> None:
+        self._bits = bytearray(self._m // 8)
+
+    def to_bytes(self) -> bytes:
+        return bytes(self._bits)
+
+    @property
+    def size_bytes(self) -> int:
+        return self._m // 8
+
 
 class ProcessedTracker:
     """
@@ -28,8 +91,13 @@ class ProcessedTracker:
     - Cross-source duplicate detection using content hashes
     - Content hash to action file mapping for adding notes
 
+    Persistence is a JSON snapshot plus an append-only JSONL sidecar
+    log: each mutation appends one line instead of rewriting the whole
+    document, and the snapshot is recompacted once the log grows past
+    a threshold.
+
     Attributes:
-        tracker_path: Path to the JSON file storing processed IDs
+        tracker_path: Path to the JSON snapshot storing processed IDs
     """
 
     def __init__(self, tracker_path: Path):
@@ -41,57 +109,216 @@ class ProcessedTracker:
                          File will be created if it doesn't exist.
         """
         self.tracker_path = tracker_path
-        self._processed: dict[str, set[str]] = {
-            'gmail': set(),
-            'file': set(),
-            'whatsapp': set(),
-            'linkedin': set()
+        self._log_path = tracker_path.with_suffix('.log')
+        self._bloom_path = tracker_path.with_suffix('.bloom')
+        self._bloom = _BloomFilter()
+        self._log_file = None
+        self._log_entries = 0
+        # One merged set keyed "source:item_id" - the same key strings
+        # the Bloom filter hashes - so each operation dispatches on a
+        # single structure; per-source counts are kept alongside
+        self._processed_keys: set[str] = set()
+        self._counts: dict[str, int] = {
+            'gmail': 0,
+            'file': 0,
+            'whatsapp': 0,
+            'linkedin': 0
         }
-        # Cross-source duplicate tracking: content_hash -> (source, item_id, action_file_path)
-        self._content_hashes: dict[str, dict[str, str]] = {}
+        # Cross-source duplicate tracking: content_hash -> (source,
+        # item_id, action_file_path) tuples - far smaller than a dict
+        # per entry at scale. None means not yet materialized from the
+        # raw snapshot/log data; watchers that never touch cross-source
+        # dedup skip the build entirely.
+        self._content_hashes: dict[str, tuple[str, str, str]] | None = {}
+        self._raw_hash_data: dict = {}
+        self._raw_hash_events: list[dict] = []
+        # Memo of (source, item_id) -> content hash so re-entries per
+        # item cost a dict hit instead of re-hashing the full text
+        self._hash_cache: dict[tuple[str, str], str] = {}
         self._load()
 
     def _load(self) -> None:
-        """Load processed IDs from the JSON file."""
+        """Load the JSON snapshot, then replay the mutation log."""
         if self.tracker_path.exists():
             try:
-                with open(self.tracker_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    self._processed = {
-                        'gmail': set(data.get('gmail', [])),
-                        'file': set(data.get('file', [])),
-                        'whatsapp': set(data.get('whatsapp', [])),
-                        'linkedin': set(data.get('linkedin', []))
-                    }
-                    # Load content hashes for cross-source duplicate detection
-                    self._content_hashes = data.get('content_hashes', {})
-            except (json.JSONDecodeError, OSError) as e:
+                # orjson parses the snapshot in Rust; sets are built
+                # straight from the decoded lists
+                data = orjson.loads(self.tracker_path.read_bytes())
+                keys = self._processed_keys
+                for source in self._counts:
+                    ids = data.get(source, [])
+                    keys.update(f"{source}:{i}" for i in ids)
+                    self._counts[source] = len(ids)
+                # Stash raw content hashes; they are normalized lazily
+                # on first cross-source dedup access
+                self._raw_hash_data = data.get('content_hashes', {})
+                self._content_hashes = None
+            except (orjson.JSONDecodeError, OSError) as e:
                 print(f"Warning: Could not load processed IDs: {e}")
                 # Start fresh if file is corrupted
-                self._processed = {
-                    'gmail': set(),
-                    'file': set(),
-                    'whatsapp': set(),
-                    'linkedin': set()
-                }
+                self._processed_keys = set()
+                self._counts = dict.fromkeys(self._counts, 0)
                 self._content_hashes = {}
+        self._load_bloom()
+        self._replay_log()
+
+    @property
+    def _hashes(self) -> dict[str, tuple[str, str, str]]:
+        """Materialize the content-hash map on first dedup access."""
+        hashes = self._content_hashes
+        if hashes is None:
+            hashes = {
+                h: self._as_hash_tuple(info)
+                for h, info in self._raw_hash_data.items()
+            }
+            for event in self._raw_hash_events:
+                hashes[event['hash']] = self._as_hash_tuple(event['info'])
+            self._raw_hash_data = {}
+            self._raw_hash_events = []
+            self._content_hashes = hashes
+        return hashes
+
+    @staticmethod
+    def _as_hash_tuple(info) -> tuple[str, str, str]:
+        """Normalize a persisted hash entry (legacy dict or list)."""
+        if isinstance(info, dict):
+            return (
+                info.get('source', ''),
+                info.get('item_id', ''),
+                info.get('action_file', '')
+            )
+        return tuple(info)
+
+    def _load_bloom(self) -> None:
+        """Load the persisted bit array, or rebuild it from the sets."""
+        if self._bloom_path.exists():
+            try:
+                raw = self._bloom_path.read_bytes()
+                if len(raw) == self._bloom.size_bytes:
+                    self._bloom = _BloomFilter(bits=bytearray(raw))
+                    return
+            except OSError as e:
+                print(f"Warning: Could not load tracker bloom filter: {e}")
+        add = self._bloom.add
+        for key in self._processed_keys:
+            add(key)
+
+    def _replay_log(self) -> None:
+        """Apply mutations recorded since the last snapshot."""
+        if not self._log_path.exists():
+            return
+        try:
+            with open(self._log_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        event = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue  # Skip a torn/corrupted tail line
+                    self._apply_event(event)
+                    self._log_entries += 1
+        except OSError as e:
+            print(f"Warning: Could not replay tracker log: {e}")
+
+    def _apply_event(self, event: dict) -> None:
+        """Apply a single logged mutation to the in-memory state."""
+        op = event.get('op')
+        if op == 'mark':
+            source = event['source']
+            key = f"{source}:{event['id']}"
+            if key not in self._processed_keys:
+                self._processed_keys.add(key)
+                self._counts[source] += 1
+            self._bloom.add(key)
+        elif op == 'unmark':
+            source = event['source']
+            key = f"{source}:{event['id']}"
+            if key in self._processed_keys:
+                self._processed_keys.discard(key)
+                self._counts[source] -= 1
+        elif op == 'hash':
+            if self._content_hashes is None:
+                self._raw_hash_events.append(event)
+            else:
+                self._content_hashes[event['hash']] = self._as_hash_tuple(
+                    event['info']
+                )
+
+    def _append_event(self, event: dict) -> None:
+        """Append one mutation line to the sidecar log (O(1) per call)."""
+        try:
+            if self._log_file is None:
+                self.tracker_path.parent.mkdir(parents=True, exist_ok=True)
+                self._log_file = open(self._log_path, 'a', encoding='utf-8')
+            self._log_file.write(json.dumps(event) + '\n')
+            self._log_file.flush()
+        except OSError as e:
+            print(f"Error: Could not append to tracker log: {e}")
+            return
+        self._log_entries += 1
+        if self._log_entries >= _COMPACT_THRESHOLD:
+            self.compact()
+
+    def compact(self) -> None:
+        """Rewrite the snapshot and bit array, then truncate the log."""
+        self._write_snapshot()
+        self._write_bloom()
+        try:
+            if self._log_file is not None:
+                self._log_file.close()
+                self._log_file = None
+            if self._log_path.exists():
+                self._log_path.unlink()
+        except OSError as e:
+            print(f"Error: Could not truncate tracker log: {e}")
+        self._log_entries = 0
 
-    def _save(self) -> None:
-        """Save processed IDs to the JSON file."""
+    def flush(self) -> None:
+        """Force the log and bit array to disk; call before shutdown."""
+        if self._log_file is not None:
+            try:
+                self._log_file.flush()
+                os.fsync(self._log_file.fileno())
+            except OSError as e:
+                print(f"Error: Could not flush tracker log: {e}")
+        self._write_bloom()
+
+    def _write_bloom(self) -> None:
+        """Persist the Bloom filter bit array next to the snapshot."""
+        try:
+            self.tracker_path.parent.mkdir(parents=True, exist_ok=True)
+            self._bloom_path.write_bytes(self._bloom.to_bytes())
+        except OSError as e:
+            print(f"Error: Could not save tracker bloom filter: {e}")
+
+    def _write_snapshot(self) -> None:
+        """Save the full processed-ID state to the JSON snapshot."""
         try:
             # Ensure parent directory exists
             self.tracker_path.parent.mkdir(parents=True, exist_ok=True)
 
-            data = {
-                'gmail': sorted(self._processed['gmail']),
-                'file': sorted(self._processed['file']),
-                'whatsapp': sorted(self._processed['whatsapp']),
-                'linkedin': sorted(self._processed['linkedin']),
-                'content_hashes': self._content_hashes
+            # Unsorted and compact: ordering is cosmetic, and sorting
+            # plus pretty-printing both scale with the whole universe.
+            # The merged key set is partitioned back into per-source
+            # lists so the snapshot format stays unchanged.
+            per_source: dict[str, list[str]] = {
+                source: [] for source in self._counts
             }
-
-            with open(self.tracker_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2)
+            for key in self._processed_keys:
+                source, _, item_id = key.partition(':')
+                per_source[source].append(item_id)
+            data = {**per_source, 'content_hashes': self._hashes}
+
+            # Durable-rename pattern: a crash mid-write leaves the old
+            # snapshot intact instead of a torn file that _load wipes
+            tmp_path = self.tracker_path.with_suffix('.tmp')
+            with open(tmp_path, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_APPEND_NEWLINE))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.tracker_path)
         except OSError as e:
             print(f"Error: Could not save processed IDs: {e}")
 
@@ -106,7 +333,13 @@ class ProcessedTracker:
         Returns:
             True if the item has been processed, False otherwise.
         """
-        return item_id in self._processed[source]
+        # Negative answers dominate (most polled items are new); the
+        # Bloom filter settles those without touching the set, and the
+        # same key string serves both structures
+        key = f"{source}:{item_id}"
+        if key not in self._bloom:
+            return False
+        return key in self._processed_keys
 
     def mark_processed(self, item_id: str, source: SourceType) -> None:
         """
@@ -116,8 +349,12 @@ class ProcessedTracker:
             item_id: Unique identifier for the item
             source: Source type ('gmail' or 'file')
         """
-        self._processed[source].add(item_id)
-        self._save()
+        key = f"{source}:{item_id}"
+        if key not in self._processed_keys:
+            self._processed_keys.add(key)
+            self._counts[source] += 1
+        self._bloom.add(key)
+        self._append_event({'op': 'mark', 'source': source, 'id': item_id})
 
     def unmark_processed(self, item_id: str, source: SourceType) -> None:
         """
@@ -127,8 +364,11 @@ class ProcessedTracker:
             item_id: Unique identifier for the item
             source: Source type ('gmail' or 'file')
         """
-        self._processed[source].discard(item_id)
-        self._save()
+        key = f"{source}:{item_id}"
+        if key in self._processed_keys:
+            self._processed_keys.discard(key)
+            self._counts[source] -= 1
+        self._append_event({'op': 'unmark', 'source': source, 'id': item_id})
 
     def get_processed_count(self, source: SourceType) -> int:
         """
@@ -140,7 +380,7 @@ class ProcessedTracker:
         Returns:
             Number of processed items.
         """
-        return len(self._processed[source])
+        return self._counts[source]
 
     def clear(self, source: SourceType | None = None) -> None:
         """
@@ -150,33 +390,75 @@ class ProcessedTracker:
             source: If provided, clear only that source. If None, clear all.
         """
         if source:
-            self._processed[source] = set()
-        else:
-            self._processed = {
-                'gmail': set(),
-                'file': set(),
-                'whatsapp': set(),
-                'linkedin': set()
+            prefix = source + ':'
+            self._processed_keys = {
+                k for k in self._processed_keys if not k.startswith(prefix)
             }
+            self._counts[source] = 0
+        else:
+            self._processed_keys = set()
+            self._counts = dict.fromkeys(self._counts, 0)
             self._content_hashes = {}
-        self._save()
-
-    def compute_content_hash(self, content: str) -> str:
+            self._raw_hash_data = {}
+            self._raw_hash_events = []
+        # Bits cannot be unset individually, so rebuild the filter from
+        # whatever survives the clear
+        self._bloom.clear()
+        add = self._bloom.add
+        for key in self._processed_keys:
+            add(key)
+        # Clearing invalidates logged history, so compact immediately
+        self.compact()
+
+    def compute_content_hash(
+        self,
+        content: str,
+        cache_key: tuple[str, str] | None = None
+    ) -> str:
         """
         Compute a hash for content to detect cross-source duplicates.
 
-        Uses SHA-256 truncated to 16 chars for compact storage while
-        maintaining sufficient uniqueness for duplicate detection.
+        Uses a 64-bit BLAKE2b digest (16 hex chars) for compact storage
+        while maintaining sufficient uniqueness for duplicate detection;
+        BLAKE2b at this output size is markedly faster than SHA-256.
 
         Args:
             content: The content string to hash (e.g., email body, message text).
+            cache_key: Optional (source, item_id) pair; when given, the
+                      result is memoized so repeat calls for the same
+                      item skip re-hashing the full text.
 
         Returns:
             A 16-character hex hash string.
         """
-        # Normalize content: lowercase, strip whitespace, remove extra spaces
-        normalized = ' '.join(content.lower().split())
-        return hashlib.sha256(normalized.encode('utf-8')).hexdigest()[:16]
+        if cache_key is not None:
+            cached = self._hash_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        # Normalize content (lowercase, collapse whitespace) by feeding
+        # tokens straight into the hash instead of materializing the
+        # joined string and its full encode copy; digest is identical
+        # to hashing ' '.join(content.lower().split())
+        h = hashlib.blake2b(digest_size=8)
+        update = h.update
+        first = True
+        for token in content.split():
+            if not token.islower():
+                token = token.lower()
+            if first:
+                first = False
+            else:
+                update(b' ')
+            update(token.encode('utf-8'))
+        content_hash = h.hexdigest()
+
+        if cache_key is not None:
+            if len(self._hash_cache) >= _HASH_CACHE_SIZE:
+                # Drop the oldest entry (insertion order) to stay bounded
+                self._hash_cache.pop(next(iter(self._hash_cache)))
+            self._hash_cache[cache_key] = content_hash
+        return content_hash
 
     def is_duplicate_content(self, content_hash: str) -> tuple[bool, str | None]:
         """
@@ -188,9 +470,9 @@ class ProcessedTracker:
         Returns:
             Tuple of (is_duplicate, action_file_path or None).
         """
-        if content_hash in self._content_hashes:
-            info = self._content_hashes[content_hash]
-            return True, info.get('action_file')
+        info = self._hashes.get(content_hash)
+        if info is not None:
+            return True, info[2]
         return False, None
 
     def register_content_hash(
@@ -209,12 +491,9 @@ class ProcessedTracker:
             item_id: The unique identifier of the item.
             action_file: Path to the action file created for this content.
         """
-        self._content_hashes[content_hash] = {
-            'source': source,
-            'item_id': item_id,
-            'action_file': action_file
-        }
-        self._save()
+        info = (source, item_id, action_file)
+        self._hashes[content_hash] = info
+        self._append_event({'op': 'hash', 'hash': content_hash, 'info': info})
 
     def get_content_hash_info(self, content_hash: str) -> dict[str, str] | None:
         """
@@ -226,14 +505,17 @@ class ProcessedTracker:
         Returns:
             Dict with source, item_id, action_file or None if not found.
         """
-        return self._content_hashes.get(content_hash)
+        info = self._hashes.get(content_hash)
+        if info is None:
+            return None
+        return {'source': info[0], 'item_id': info[1], 'action_file': info[2]}
 
     def __repr__(self) -> str:
         return (
             f"ProcessedTracker("
-            f"gmail={len(self._processed['gmail'])}, "
-            f"file={len(self._processed['file'])}, "
-            f"whatsapp={len(self._processed['whatsapp'])}, "
-            f"linkedin={len(self._processed['linkedin'])}, "
-            f"content_hashes={len(self._content_hashes)})"
+            f"gmail={self._counts['gmail']}, "
+            f"file={self._counts['file']}, "
+            f"whatsapp={self._counts['whatsapp']}, "
+            f"linkedin={self._counts['linkedin']}, "
+            f"content_hashes={len(self._hashes)})"
         )
@@ -5,16 +5,36 @@ Defines the WatcherInstance dataclass for tracking running watcher
 processes, their status, and runtime metrics.
 """
 
+import time
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import Any, Literal
 
 
+# Bound once so hot record paths skip the module attribute lookup
+_now = datetime.now
+
+
 WatcherType = Literal['gmail', 'whatsapp', 'linkedin', 'filesystem']
 WatcherStatus = Literal['online', 'stopped', 'crashed', 'starting', 'unknown']
 
+# Built once instead of per get_status_emoji call
+_STATUS_EMOJIS = {
+    'online': '✅',      # Green check
+    'stopped': '🛑',  # Stop sign
+    'crashed': '❌',     # Red X
+    'starting': '🔄',  # Rotating arrows
+    'unknown': '❔'      # Question mark
+}
+
+# Prebound markdown row template; the bound .format skips re-parsing
+# the literal on every dashboard refresh
+_ROW_FMT = (
+    "| {wt} | {em} {st} | {lc} | {today} | {up} | {stab} |"
+).format
 
-@dataclass
+
+@dataclass(slots=True)
 class WatcherHealth:
     """
     Health metrics for a watcher instance.
@@ -32,7 +52,7 @@ class WatcherHealth:
     def record_error(self, error: str) -> None:
         """Record an error occurrence."""
         self.last_error = error
-        self.last_error_time = datetime.now()
+        self.last_error_time = _now()
         self.consecutive_errors += 1
 
     def clear_errors(self) -> None:
@@ -44,7 +64,7 @@ class WatcherHealth:
         return self.consecutive_errors == 0
 
 
-@dataclass
+@dataclass(slots=True)
 class WatcherConfig:
     """
     Configuration for a watcher instance.
@@ -60,7 +80,7 @@ class WatcherConfig:
     source_specific_config: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class WatcherInstance:
     """
     Represents a running watcher process.
@@ -98,6 +118,14 @@ class WatcherInstance:
     config: WatcherConfig = field(default_factory=WatcherConfig)
     health: WatcherHealth = field(default_factory=WatcherHealth)
     start_time: datetime | None = None
+    # (uptime_seconds, formatted) memo; dashboards call to_dict many
+    # times between uptime updates
+    _uptime_display_cache: tuple[int, str] | None = field(
+        default=None, repr=False, compare=False
+    )
+    # Monotonic start reference; immune to wall-clock jumps and much
+    # cheaper to diff than datetime.now() on busy watchers
+    _start_ns: int | None = field(default=None, repr=False, compare=False)
 
     def is_online(self) -> bool:
         """
@@ -123,8 +151,14 @@ class WatcherInstance:
 
         Should be called periodically to keep uptime current.
         """
-        if self.start_time:
-            delta = datetime.now() - self.start_time
+        if self._start_ns is not None:
+            self.uptime_seconds = (
+                time.monotonic_ns() - self._start_ns
+            ) // 1_000_000_000
+        elif self.start_time:
+            # Instances rebuilt via from_dict only carry the wallclock
+            # start; fall back to datetime arithmetic for those
+            delta = _now() - self.start_time
             self.uptime_seconds = int(delta.total_seconds())
 
     def get_uptime_display(self) -> str:
@@ -134,20 +168,26 @@ class WatcherInstance:
         Returns:
             Uptime in format like "24h 15m" or "2d 3h".
         """
-        if self.uptime_seconds <= 0:
+        seconds = self.uptime_seconds
+        if seconds <= 0:
             return '0m'
 
-        delta = timedelta(seconds=self.uptime_seconds)
-        days = delta.days
-        hours, remainder = divmod(delta.seconds, 3600)
+        cached = self._uptime_display_cache
+        if cached is not None and cached[0] == seconds:
+            return cached[1]
+
+        days, day_seconds = divmod(seconds, 86400)
+        hours, remainder = divmod(day_seconds, 3600)
         minutes = remainder // 60
 
         if days > 0:
-            return f"{days}d {hours}h"
+            display = f"{days}d {hours}h"
         elif hours > 0:
-            return f"{hours}h {minutes}m"
+            display = f"{hours}h {minutes}m"
         else:
-            return f"{minutes}m"
+            display = f"{minutes}m"
+        self._uptime_display_cache = (seconds, display)
+        return display
 
     def record_check(self, items_detected: int = 0) -> None:
         """
@@ -156,7 +196,7 @@ class WatcherInstance:
         Args:
             items_detected: Number of items detected in this cycle.
         """
-        self.last_check_time = datetime.now()
+        self.last_check_time = _now()
         self.items_detected_today += items_detected
         self.items_detected_total += items_detected
         self.health.clear_errors()
@@ -170,7 +210,7 @@ class WatcherInstance:
             reason: Why the watcher restarted.
         """
         self.restart_count += 1
-        self.last_restart_time = datetime.now()
+        self.last_restart_time = _now()
         self.last_restart_reason = reason
         self.status = 'starting'
 
@@ -183,7 +223,8 @@ class WatcherInstance:
         """
         self.status = 'online'
         self.process_id = process_id
-        self.start_time = datetime.now()
+        self.start_time = _now()
+        self._start_ns = time.monotonic_ns()
         self.uptime_seconds = 0
 
     def record_stop(self) -> None:
@@ -213,14 +254,7 @@ class WatcherInstance:
         Returns:
             Emoji representing the current status.
         """
-        status_emojis = {
-            'online': '\u2705',      # Green check
-            'stopped': '\ud83d\uded1',  # Stop sign
-            'crashed': '\u274c',     # Red X
-            'starting': '\ud83d\udd04',  # Rotating arrows
-            'unknown': '\u2754'      # Question mark
-        }
-        return status_emojis.get(self.status, '\u2754')
+        return _STATUS_EMOJIS.get(self.status, '\u2754')
 
     def get_stability_label(self) -> str:
         """
@@ -338,15 +372,16 @@ class WatcherInstance:
         Returns:
             Markdown table row string.
         """
-        emoji = self.get_status_emoji()
-        last_check = 'Never'
-        if self.last_check_time:
-            last_check = self.last_check_time.strftime('%H:%M:%S')
-
-        stability = self.get_stability_label()
-
-        return (
-            f"| {self.watcher_type} | {emoji} {self.status} | "
-            f"{last_check} | {self.items_detected_today} | "
-            f"{self.get_uptime_display()} | {stability} |"
+        last_check_time = self.last_check_time
+        return _ROW_FMT(
+            wt=self.watcher_type,
+            em=_STATUS_EMOJIS.get(self.status, '❔'),
+            st=self.status,
+            lc=(
+                last_check_time.isoformat(sep=' ', timespec='seconds')[11:]
+                if last_check_time else 'Never'
+            ),
+            today=self.items_detected_today,
+            up=self.get_uptime_display(),
+            stab=self.get_stability_label()
         )
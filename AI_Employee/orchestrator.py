@@ -6,7 +6,7 @@ coordinates their execution via MCP servers. Implements the
 Human-in-the-Loop (HITL) workflow execution phase.
 
 Features:
-- Polls /Approved/ folder every 60 seconds
+- Reacts to file events in /Approved/ via OS notifications (watchdog)
 - Validates approval request files
 - Checks for expiration (24-hour timeout)
 - Handles malformed files gracefully
@@ -15,18 +15,80 @@ Features:
 """
 
 import logging
+import os
+import queue
 import re
-import shutil
-import time
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any
 
-from .models.approval_request import ApprovalRequest, parse_approval_file
+import yaml
+from watchdog.events import FileSystemEvent, PatternMatchingEventHandler
+from watchdog.observers import Observer
+
+from .models.approval_request import (
+    ApprovalRequest,
+    approval_from_frontmatter,
+    parse_approval_file,
+)
 from .utils.audit_logger import AuditLogger
 from .utils.config import Config
 
 
+# Required fields for valid approval request
+REQUIRED_FIELDS = [
+    'action_type', 'target', 'mcp_server', 'created_timestamp'
+]
+
+# Patterns compiled once at import; the event loop runs them per file
+
+# Cap on tracked rejection filenames; oldest entries are evicted so a
+# long-running daemon's memory stays bounded
+_REJECTED_CACHE_SIZE = 10_000
+
+# Max audit events folded into one log rewrite by the drain thread
+_AUDIT_BATCH_SIZE = 64
+_STATUS_SUB_RE = re.compile(r'^status:\s*\w+', re.MULTILINE)
+_ID_RE = re.compile(r'^id:\s*"?([^"\n]+)"?', re.MULTILINE)
+
+
+def _scan_markdown(dir_path: Path) -> list[tuple[str, str]]:
+    """
+    List Markdown files in a folder as (name, path) pairs.
+
+    One os.scandir pass instead of Path.glob, so no per-entry Path
+    objects are built and no extra stat calls are made. Returns an
+    empty list if the folder does not exist.
+    """
+    try:
+        with os.scandir(dir_path) as it:
+            return [
+                (entry.name, entry.path)
+                for entry in it
+                if entry.name.endswith('.md') and entry.is_file()
+            ]
+    except OSError:
+        return []
+
+
+class _ApprovalFolderHandler(PatternMatchingEventHandler):
+    """Enqueues Markdown files created in or moved into a watched folder."""
+
+    def __init__(self, folder: str, event_queue: 'queue.Queue[tuple[str, Path]]'):
+        super().__init__(patterns=['*.md'], ignore_directories=True)
+        self.folder = folder
+        self.event_queue = event_queue
+
+    def on_created(self, event: FileSystemEvent) -> None:
+        self.event_queue.put((self.folder, Path(event.src_path)))
+
+    def on_moved(self, event: FileSystemEvent) -> None:
+        self.event_queue.put((self.folder, Path(event.dest_path)))
+
+
 class ApprovalOrchestrator:
     """
     Orchestrates the approval workflow for external actions.
@@ -45,9 +107,7 @@ class ApprovalOrchestrator:
     """
 
     # Required fields for valid approval request
-    REQUIRED_FIELDS = [
-        'action_type', 'target', 'mcp_server', 'created_timestamp'
-    ]
+    REQUIRED_FIELDS = REQUIRED_FIELDS
 
     # Valid action types
     VALID_ACTION_TYPES = ['email_send', 'linkedin_post', 'browser_action', 'custom']
@@ -74,9 +134,32 @@ class ApprovalOrchestrator:
         self.audit_logger = AuditLogger(config.logs_path)
         self.logger = logging.getLogger(self.__class__.__name__)
 
-        # Track processed files to avoid re-processing
-        self._processed_files: set[str] = set()
-        self._rejected_files: set[str] = set()
+        # File events from the watchdog observer
+        self._event_queue: queue.Queue[tuple[str, Path]] = queue.Queue()
+        self._observer: Observer | None = None
+
+        # Rejections the orchestrator made itself, so the /Rejected/
+        # event handler doesn't audit-log them a second time. Bounded
+        # LRU: oldest names are evicted past _REJECTED_CACHE_SIZE.
+        # Guarded by a lock since pool workers record rejections too.
+        self._rejected_files: OrderedDict[str, None] = OrderedDict()
+        self._rejected_lock = threading.Lock()
+
+        # Per-file work is I/O-bound (read, parse, move), so folder
+        # sweeps fan out across a small thread pool
+        self._pool = ThreadPoolExecutor(
+            max_workers=8, thread_name_prefix='approval'
+        )
+
+        # Audit writes happen off the scan path: events queue up here
+        # and a background thread batches them into one log rewrite
+        self._audit_q: queue.Queue[tuple[str, str, str | None] | None] = (
+            queue.Queue()
+        )
+        self._audit_thread = threading.Thread(
+            target=self._drain_audit, name='audit-drain', daemon=True
+        )
+        self._audit_thread.start()
 
         # Ensure folders exist
         config.ensure_vault_structure(include_silver=True)
@@ -87,36 +170,57 @@ class ApprovalOrchestrator:
 
     def run(self) -> None:
         """
-        Main loop: poll /Approved/ and /Rejected/ folders.
-
-        Runs indefinitely until stopped. Each cycle:
-        1. Scans /Approved/ for new files
-        2. Validates and processes approved requests
-        3. Checks /Pending_Approval/ for expired requests
-        4. Scans /Rejected/ for rejection logging
-        5. Sleeps for check_interval seconds
+        Main loop: react to file events in the approval folders.
+
+        The OS delivers file notifications (inotify/FSEvents) for
+        /Approved/ and /Rejected/ through watchdog, so idle time costs
+        nothing and new files are handled within milliseconds instead
+        of waiting out a polling sleep. An initial sweep picks up files
+        that existed before the observer attached, and the expiration
+        check for /Pending_Approval/ still runs every check_interval
+        seconds via the queue timeout.
         """
         self.running = True
         self.logger.info("Starting ApprovalOrchestrator...")
 
+        self._observer = Observer()
+        for folder, path in (
+            ('approved', self.config.approved_path),
+            ('rejected', self.config.rejected_path),
+        ):
+            self._observer.schedule(
+                _ApprovalFolderHandler(folder, self._event_queue),
+                str(path),
+                recursive=False
+            )
+        self._observer.start()
+
         try:
+            # Pick up files that existed before the observer attached
+            self._process_approved_folder()
+            self._check_expired_approvals()
+            self._process_rejected_folder()
+
             while self.running:
                 try:
-                    # Process approved files
-                    self._process_approved_folder()
-
-                    # Check for expired pending approvals
+                    folder, file_path = self._event_queue.get(
+                        timeout=self.check_interval
+                    )
+                except queue.Empty:
+                    # No events; run the periodic expiration sweep
                     self._check_expired_approvals()
+                    continue
 
-                    # Log any new rejections
-                    self._process_rejected_folder()
-
+                try:
+                    if folder == 'approved':
+                        self.logger.info(
+                            "Processing approved file: %s", file_path.name
+                        )
+                        self.process_approved_file(file_path)
+                    elif folder == 'rejected':
+                        self._log_rejection(file_path)
                 except Exception as e:
-                    self.logger.error(f"Error in orchestrator cycle: {e}")
-
-                # Sleep until next check
-                self.logger.debug(f"Sleeping for {self.check_interval}s...")
-                time.sleep(self.check_interval)
+                    self.logger.error(f"Error processing {file_path.name}: {e}")
 
         except KeyboardInterrupt:
             self.logger.info("Received shutdown signal")
@@ -126,29 +230,70 @@ class ApprovalOrchestrator:
     def stop(self) -> None:
         """Stop the orchestrator gracefully."""
         self.running = False
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join(timeout=5)
+            self._observer = None
+        self._pool.shutdown(wait=True, cancel_futures=True)
+        if self._audit_thread.is_alive():
+            self._audit_q.put(None)
+            self._audit_thread.join(timeout=5)
         self.logger.info("ApprovalOrchestrator stopped")
 
-    def _process_approved_folder(self) -> None:
-        """Scan and process files in /Approved/ folder."""
-        approved_path = self.config.approved_path
-        if not approved_path.exists():
-            return
+    def _drain_audit(self) -> None:
+        """
+        Consume queued audit events and write them in batches.
 
-        for file_path in approved_path.glob('*.md'):
-            # Skip already processed files
-            if file_path.name in self._processed_files:
-                continue
+        Runs on a daemon thread; blocks on the queue, then gathers up
+        to _AUDIT_BATCH_SIZE further events (waiting at most a second
+        for stragglers) before one batched log write. A None sentinel
+        from stop() flushes what is pending and exits.
+        """
+        while True:
+            event = self._audit_q.get()
+            if event is None:
+                return
+
+            events = [event]
+            while len(events) < _AUDIT_BATCH_SIZE:
+                try:
+                    event = self._audit_q.get(timeout=1.0)
+                except queue.Empty:
+                    break
+                if event is None:
+                    self._write_audit_batch(events)
+                    return
+                events.append(event)
+
+            self._write_audit_batch(events)
+
+    def _write_audit_batch(
+        self, events: list[tuple[str, str, str | None]]
+    ) -> None:
+        """Write one batch of audit events, logging failures."""
+        try:
+            self.audit_logger.log_approval_workflow_batch(events)
+        except Exception as e:
+            self.logger.error(f"Audit batch write failed: {e}")
 
-            self.logger.info(f"Processing approved file: {file_path.name}")
+    def _process_approved_folder(self) -> None:
+        """Process files already present in /Approved/ (startup sweep)."""
+        entries = _scan_markdown(self.config.approved_path)
+        if not entries:
+            return
 
+        def worker(entry: tuple[str, str]) -> None:
+            entry_name, entry_path = entry
+            self.logger.info("Processing approved file: %s", entry_name)
             try:
-                result = self.process_approved_file(file_path)
-                if result:
-                    self._processed_files.add(file_path.name)
+                self.process_approved_file(entry_path)
             except Exception as e:
-                self.logger.error(f"Error processing {file_path.name}: {e}")
+                self.logger.error(f"Error processing {entry_name}: {e}")
+
+        # Drain the map iterator; results are None, we want completion
+        list(self._pool.map(worker, entries))
 
-    def process_approved_file(self, file_path: Path) -> bool:
+    def process_approved_file(self, file_path: str | Path) -> bool:
         """
         Process a single approved request file.
 
@@ -161,11 +306,15 @@ class ApprovalOrchestrator:
         Returns:
             True if file is valid and ready for execution, False otherwise.
         """
+        # Accept raw scandir strings; build the Path exactly once here
+        file_path = Path(file_path)
+
         # Validate file structure
-        validation_errors = self._validate_approval_file(file_path)
+        validation_errors, frontmatter = self._validate_approval_file(file_path)
         if validation_errors:
             self.logger.warning(
-                f"Malformed approval file: {file_path.name} - {validation_errors}"
+                "Malformed approval file: %s - %s",
+                file_path.name, validation_errors
             )
             self._move_to_rejected(
                 file_path,
@@ -173,8 +322,9 @@ class ApprovalOrchestrator:
             )
             return False
 
-        # Parse the approval request
-        approval = parse_approval_file(file_path)
+        # Build the approval request from the frontmatter parsed during
+        # validation (no second read/parse of the file)
+        approval = approval_from_frontmatter(frontmatter) if frontmatter else None
         if not approval:
             self.logger.error(f"Failed to parse approval file: {file_path.name}")
             self._move_to_rejected(file_path, reason="Failed to parse file")
@@ -182,7 +332,7 @@ class ApprovalOrchestrator:
 
         # Check expiration
         if self._is_expired(approval):
-            self.logger.warning(f"Approval expired: {file_path.name}")
+            self.logger.warning("Approval expired: %s", file_path.name)
             self._move_to_rejected(
                 file_path,
                 reason=f"Expired (created {approval.created_timestamp.isoformat()})"
@@ -190,14 +340,21 @@ class ApprovalOrchestrator:
             return False
 
         self.logger.info(
-            f"Approved request ready: {approval.action_type} -> {approval.target}"
+            "Approved request ready: %s -> %s",
+            approval.action_type, approval.target
         )
         return True
 
-    def _validate_approval_file(self, file_path: Path) -> list[str]:
+    def _validate_approval_file(
+        self, file_path: Path
+    ) -> tuple[list[str], dict[str, Any] | None]:
         """
         Validate an approval request file structure.
 
+        A single yaml.safe_load of the frontmatter replaces per-field
+        regex scans, and the parsed dict is handed back so the caller
+        can build the ApprovalRequest without re-parsing the file.
+
         Checks:
         - File can be read
         - Has valid YAML frontmatter
@@ -208,123 +365,175 @@ class ApprovalOrchestrator:
             file_path: Path to the approval file.
 
         Returns:
-            List of validation error messages (empty if valid).
+            Tuple of (validation errors, parsed frontmatter dict).
+            The dict is None when the frontmatter could not be parsed.
         """
-        errors: list[str] = []
+        # Size sanity check before reading: a tiny file cannot hold the
+        # frontmatter plus required fields, and a huge one is suspect
+        try:
+            size = file_path.stat().st_size
+        except OSError as e:
+            return ([f"Cannot read file: {e}"], None)
+        if size < 100:
+            return (["File too small to be a valid approval"], None)
+        if size > 1 << 20:
+            return (["File exceeds 1 MiB sanity limit"], None)
 
         try:
             content = file_path.read_text(encoding='utf-8')
         except OSError as e:
-            return [f"Cannot read file: {e}"]
+            return ([f"Cannot read file: {e}"], None)
+
+        # Extract frontmatter via string ops (no backtracking regex)
+        if not content.startswith('---'):
+            return (["Missing or invalid YAML frontmatter"], None)
+        opening, sep, rest = content.partition('\n')
+        if not sep or opening[3:].strip():
+            return (["Missing or invalid YAML frontmatter"], None)
+        end = rest.find('\n---')
+        if end < 0:
+            return (["Missing or invalid YAML frontmatter"], None)
 
-        # Check for YAML frontmatter
-        frontmatter_match = re.match(
-            r'^---\s*\n(.*?)\n---',
-            content,
-            re.DOTALL
-        )
-        if not frontmatter_match:
-            return ["Missing or invalid YAML frontmatter"]
+        try:
+            data = yaml.safe_load(rest[:end])
+        except yaml.YAMLError as e:
+            return ([f"Invalid YAML frontmatter: {e}"], None)
+        if not isinstance(data, dict):
+            return (["Missing or invalid YAML frontmatter"], None)
 
-        frontmatter = frontmatter_match.group(1)
+        errors: list[str] = []
 
         # Check required fields
         for field in self.REQUIRED_FIELDS:
-            pattern = rf'^{field}:\s*\S+'
-            if not re.search(pattern, frontmatter, re.MULTILINE):
+            if data.get(field) in (None, ''):
                 errors.append(f"Missing required field: {field}")
 
         # Check action type is valid
-        action_match = re.search(r'^action_type:\s*(\w+)', frontmatter, re.MULTILINE)
-        if action_match:
-            action_type = action_match.group(1)
-            if action_type not in self.VALID_ACTION_TYPES:
-                errors.append(f"Invalid action_type: {action_type}")
+        action_type = data.get('action_type')
+        if action_type is not None and action_type not in self.VALID_ACTION_TYPES:
+            errors.append(f"Invalid action_type: {action_type}")
 
         # Check type field is approval_request
-        type_match = re.search(r'^type:\s*(\w+)', frontmatter, re.MULTILINE)
-        if type_match:
-            if type_match.group(1) != 'approval_request':
-                errors.append("File type is not 'approval_request'")
-        else:
+        file_type = data.get('type')
+        if file_type is None:
             errors.append("Missing type field")
+        elif file_type != 'approval_request':
+            errors.append("File type is not 'approval_request'")
 
-        return errors
+        return (errors, data)
 
-    def _is_expired(self, approval: ApprovalRequest) -> bool:
+    def _is_expired(
+        self, approval: ApprovalRequest, now: datetime | None = None
+    ) -> bool:
         """
         Check if an approval request has expired.
 
         Args:
             approval: Parsed ApprovalRequest object.
+            now: Reference time; callers sweeping many files snapshot
+                it once instead of re-reading the clock per file.
 
         Returns:
             True if expired (older than expiration_hours).
         """
+        if now is None:
+            now = datetime.now()
         expiration_time = approval.created_timestamp + timedelta(
             hours=self.expiration_hours
         )
-        return datetime.now() > expiration_time
+        return now > expiration_time
+
+    def _remember_rejection(self, name: str) -> None:
+        """Track a logged rejection, evicting the oldest past the cap."""
+        with self._rejected_lock:
+            rejected = self._rejected_files
+            rejected[name] = None
+            rejected.move_to_end(name)
+            if len(rejected) > _REJECTED_CACHE_SIZE:
+                rejected.popitem(last=False)
 
     def _check_expired_approvals(self) -> None:
         """Check /Pending_Approval/ for expired requests and move them."""
-        pending_path = self.config.pending_approval_path
-        if not pending_path.exists():
+        # Drop tracked rejections whose files are gone so the cache
+        # follows on-disk state instead of growing with daemon uptime
+        with self._rejected_lock:
+            if self._rejected_files:
+                on_disk = {
+                    name for name, _ in _scan_markdown(self.config.rejected_path)
+                }
+                for name in [
+                    n for n in self._rejected_files if n not in on_disk
+                ]:
+                    del self._rejected_files[name]
+
+        entries = _scan_markdown(self.config.pending_approval_path)
+        if not entries:
             return
 
+        # One clock read for the whole sweep
         now = datetime.now()
-        expiration_delta = timedelta(hours=self.expiration_hours)
 
-        for file_path in pending_path.glob('*.md'):
+        def worker(entry: tuple[str, str]) -> None:
+            entry_name, entry_path = entry
             try:
+                file_path = Path(entry_path)
                 approval = parse_approval_file(file_path)
-                if approval and self._is_expired(approval):
+                if approval and self._is_expired(approval, now):
                     self.logger.warning(
-                        f"Pending approval expired: {file_path.name}"
+                        "Pending approval expired: %s", entry_name
                     )
                     self._move_to_rejected(
                         file_path,
                         reason=f"Expired after {self.expiration_hours} hours without approval"
                     )
             except Exception as e:
-                self.logger.debug(f"Error checking expiration for {file_path.name}: {e}")
+                self.logger.debug("Error checking expiration for %s: %s", entry_name, e)
+
+        list(self._pool.map(worker, entries))
 
     def _process_rejected_folder(self) -> None:
         """
         Scan /Rejected/ folder for new rejections and log them.
 
-        This handles cases where a user manually moves a file to /Rejected/.
+        This handles cases where a user manually moved a file to
+        /Rejected/ before the orchestrator started; later manual moves
+        arrive as file events.
         """
-        rejected_path = self.config.rejected_path
-        if not rejected_path.exists():
-            return
-
-        for file_path in rejected_path.glob('*.md'):
-            # Skip already logged rejections
+        entries = _scan_markdown(self.config.rejected_path)
+        if entries:
+            list(self._pool.map(
+                self._log_rejection,
+                (Path(entry_path) for _, entry_path in entries)
+            ))
+
+    def _log_rejection(self, file_path: Path) -> None:
+        """Audit-log a file that appeared in /Rejected/."""
+        # Skip rejections the orchestrator made itself; those were
+        # already logged by _move_to_rejected
+        with self._rejected_lock:
             if file_path.name in self._rejected_files:
-                continue
+                return
 
-            # Log the rejection
-            try:
-                approval = parse_approval_file(file_path)
-                if approval:
-                    self.audit_logger.log_approval_workflow(
-                        'approval_rejected',
-                        approval.id,
-                        approver='user'
-                    )
-                    self.logger.info(f"Logged rejection: {file_path.name}")
+        try:
+            approval = parse_approval_file(file_path)
+            if approval:
+                self._audit_q.put(('approval_rejected', approval.id, 'user'))
+                self.logger.info("Logged rejection: %s", file_path.name)
 
-                self._rejected_files.add(file_path.name)
+            self._remember_rejection(file_path.name)
 
-            except Exception as e:
-                self.logger.debug(f"Error logging rejection {file_path.name}: {e}")
-                self._rejected_files.add(file_path.name)
+        except Exception as e:
+            self.logger.debug("Error logging rejection %s: %s", file_path.name, e)
+            self._remember_rejection(file_path.name)
 
     def _move_to_rejected(self, file_path: Path, reason: str) -> Path | None:
         """
         Move a file to /Rejected/ folder with rejection note.
 
+        The move itself is an atomic os.replace, so a crash never
+        leaves the request missing from both folders; the status flip
+        and rejection note are applied in place afterwards.
+
         Args:
             file_path: Path to the file to reject.
             reason: Rejection reason to add to notes.
@@ -336,44 +545,45 @@ class ApprovalOrchestrator:
             # Ensure /Rejected/ exists
             self.config.rejected_path.mkdir(parents=True, exist_ok=True)
 
-            # Read and update content
-            content = file_path.read_text(encoding='utf-8')
-
-            # Update status to rejected
-            content = re.sub(
-                r'^status:\s*\w+',
-                'status: rejected',
-                content,
-                flags=re.MULTILINE
-            )
+            # Atomic same-filesystem move first
+            new_path = self.config.rejected_path / file_path.name
+            os.replace(file_path, new_path)
 
-            # Add rejection note
             rejection_note = (
                 f"\n\n**Rejection Reason**: {reason}\n"
                 f"**Rejected At**: {datetime.now().isoformat()}\n"
             )
 
-            if '## Notes' in content:
-                content = content.replace('## Notes\n', f'## Notes{rejection_note}')
-            else:
-                content += f"\n## Notes{rejection_note}"
+            with open(new_path, 'r+', encoding='utf-8') as f:
+                content = f.read()
 
-            # Move file
-            new_path = self.config.rejected_path / file_path.name
-            file_path.unlink()  # Remove original
-            new_path.write_text(content, encoding='utf-8')
+                # Update status to rejected (skip if already flipped)
+                if 'status: rejected' not in content:
+                    content = _STATUS_SUB_RE.sub(
+                        'status: rejected', content, count=1
+                    )
+
+                # Add rejection note
+                if '## Notes' in content:
+                    content = content.replace(
+                        '## Notes\n', f'## Notes{rejection_note}'
+                    )
+                else:
+                    content += f"\n## Notes{rejection_note}"
+
+                f.seek(0)
+                f.write(content)
+                f.truncate()
 
             # Log rejection
-            id_match = re.search(r'^id:\s*"?([^"\n]+)"?', content, re.MULTILINE)
+            id_match = _ID_RE.search(content)
             if id_match:
-                self.audit_logger.log_approval_workflow(
-                    'approval_rejected',
-                    id_match.group(1),
-                    approver='system'
+                self._audit_q.put(
+                    ('approval_rejected', id_match.group(1), 'system')
                 )
 
-            self._rejected_files.add(new_path.name)
-            self.logger.info(f"Moved to rejected: {new_path.name}")
+            self._remember_rejection(new_path.name)
+            self.logger.info("Moved to rejected: %s", new_path.name)
 
             return new_path
 
@@ -388,16 +598,18 @@ class ApprovalOrchestrator:
         Returns:
             Dict with count, oldest_age_hours, is_overdue.
         """
-        pending_path = self.config.pending_approval_path
-        if not pending_path.exists():
-            return {
-                'count': 0,
-                'oldest_age_hours': 0,
-                'is_overdue': False
-            }
+        # DirEntry caches the stat result from the scandir pass, so the
+        # oldest-mtime reduction costs no extra syscalls
+        try:
+            with os.scandir(self.config.pending_approval_path) as it:
+                entries = [
+                    entry for entry in it
+                    if entry.name.endswith('.md') and entry.is_file()
+                ]
+        except OSError:
+            entries = []
 
-        files = list(pending_path.glob('*.md'))
-        count = len(files)
+        count = len(entries)
 
         if count == 0:
             return {
@@ -407,7 +619,7 @@ class ApprovalOrchestrator:
             }
 
         # Find oldest file
-        oldest_mtime = min(f.stat().st_mtime for f in files)
+        oldest_mtime = min(entry.stat().st_mtime for entry in entries)
         oldest_dt = datetime.fromtimestamp(oldest_mtime)
         age_hours = (datetime.now() - oldest_dt).total_seconds() / 3600
 
@@ -16,6 +16,7 @@ PM2 Usage:
     (PM2 will call: python run_watcher.py gmail)
 """
 
+import importlib
 import logging
 import sys
 from pathlib import Path
@@ -24,10 +25,22 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from utils.config import Config
-from watchers.filesystem_watcher import FilesystemWatcher
-from watchers.gmail_watcher import GmailWatcher
-from watchers.linkedin_watcher import LinkedInWatcher
-from watchers.whatsapp_watcher import WhatsAppWatcher
+
+# Watcher classes are imported lazily so each PM2 process only pays
+# for its own watcher's dependency tree (Google API client, Selenium,
+# etc.), not all four
+_WATCHER_CLASSES = {
+    'filesystem': 'watchers.filesystem_watcher:FilesystemWatcher',
+    'gmail': 'watchers.gmail_watcher:GmailWatcher',
+    'whatsapp': 'watchers.whatsapp_watcher:WhatsAppWatcher',
+    'linkedin': 'watchers.linkedin_watcher:LinkedInWatcher',
+}
+
+
+def _load_watcher_class(watcher_type: str):
+    """Import and return the watcher class for the given type."""
+    module_name, _, class_name = _WATCHER_CLASSES[watcher_type].partition(':')
+    return getattr(importlib.import_module(module_name), class_name)
 
 
 def setup_logging(level: str = 'INFO') -> None:
@@ -85,28 +98,17 @@ def main() -> int:
     logger.info(f"Vault structure verified at {config.vault_path}")
 
     # Create the appropriate watcher
+    if watcher_type not in _WATCHER_CLASSES:
+        logger.error(f"Unknown watcher type: {watcher_type}")
+        logger.error("Valid types: gmail, whatsapp, linkedin, filesystem")
+        return 1
+
     try:
+        logger.info(f"Initializing {watcher_type} watcher...")
         if watcher_type == 'filesystem':
-            logger.info("Initializing filesystem watcher...")
             logger.info(f"Watch path: {config.watch_path}")
-            watcher = FilesystemWatcher(config)
-
-        elif watcher_type == 'gmail':
-            logger.info("Initializing Gmail watcher...")
-            watcher = GmailWatcher(config)
-
-        elif watcher_type == 'whatsapp':
-            logger.info("Initializing WhatsApp watcher...")
-            watcher = WhatsAppWatcher(config)
-
-        elif watcher_type == 'linkedin':
-            logger.info("Initializing LinkedIn watcher...")
-            watcher = LinkedInWatcher(config)
-
-        else:
-            logger.error(f"Unknown watcher type: {watcher_type}")
-            logger.error("Valid types: gmail, whatsapp, linkedin, filesystem")
-            return 1
+        watcher_class = _load_watcher_class(watcher_type)
+        watcher = watcher_class(config)
 
     except FileNotFoundError as e:
         logger.error(f"File not found: {e}")
@@ -19,14 +19,20 @@ Usage:
 """
 
 import argparse
+import functools
+import hashlib
 import json
 import logging
+import math
 import os
 import sys
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime, timedelta
 from pathlib import Path
 from typing import Any, Optional
 
+import orjson
 from groq import Groq
 
 # Add parent directory to path
@@ -86,31 +92,44 @@ def get_xero_financial_data(period_start: date, period_end: date) -> Optional[di
     """
     try:
         # Import Xero MCP tools
-        from AI_Employee.mcp_servers.xero_mcp import get_financial_report
-        
-        # Get Profit & Loss report
-        report = get_financial_report(
-            report_type="profit_and_loss",
-            from_date=period_start.isoformat(),
-            to_date=period_end.isoformat()
-        )
-        
-        # Get invoices for outstanding calculation
-        from AI_Employee.mcp_servers.xero_mcp import get_invoices
-        invoices = get_invoices(
-            status="AUTHORISED",
-            date_from=period_start.isoformat(),
-            date_to=period_end.isoformat()
-        )
-        
-        # Calculate outstanding invoices
-        outstanding_count = 0
-        outstanding_amount = 0.0
-        for inv in invoices.get('invoices', []):
-            amount_due = inv.get('amount_due', 0.0)
-            if amount_due > 0:
-                outstanding_count += 1
-                outstanding_amount += amount_due
+        from AI_Employee.mcp_servers.xero_mcp import get_financial_report, get_invoices
+
+        # The P&L report and invoice list are independent round-trips;
+        # overlap them so latency is max(report, invoices), not the sum
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            report_future = pool.submit(
+                get_financial_report,
+                report_type="profit_and_loss",
+                from_date=period_start.isoformat(),
+                to_date=period_end.isoformat()
+            )
+            invoices_future = pool.submit(
+                get_invoices,
+                status="AUTHORISED",
+                date_from=period_start.isoformat(),
+                date_to=period_end.isoformat()
+            )
+
+            report = report_future.result()
+
+            # A failed invoice fetch still yields partial financials
+            try:
+                invoices = invoices_future.result()
+            except Exception as e:
+                logger.warning(f"Failed to get Xero invoices: {e}")
+                invoices = {}
+
+        # Calculate outstanding invoices in one pass; fsum keeps the
+        # float accumulation exact over long invoice lists
+        dues = [
+            due for due in (
+                inv.get('amount_due', 0.0)
+                for inv in invoices.get('invoices', [])
+            )
+            if due > 0
+        ]
+        outstanding_count = len(dues)
+        outstanding_amount = math.fsum(dues)
         
         # Build financial summary
         financial_data = {
@@ -138,113 +157,175 @@ def get_xero_financial_data(period_start: date, period_end: date) -> Optional[di
         return None
 
 
-def get_social_media_data(period_start: date, period_end: date) -> Optional[dict[str, Any]]:
-    """
-    Get social media engagement data from Facebook, Instagram, Twitter MCP servers.
-    
-    Args:
-        period_start: Start date for engagement metrics
-        period_end: End date for engagement metrics
-    
-    Returns:
-        Social media engagement data dictionary or None if unavailable
-    """
-    platforms = []
-    unavailable_platforms = []
-    
-    # Facebook
+def _fetch_facebook(
+    since_iso: str,
+    until_iso: str
+) -> tuple[Optional[PlatformEngagement], Optional[str]]:
+    """Fetch Facebook engagement; returns (engagement, unavailable name)."""
+    # Check credentials before importing so an unconfigured platform
+    # never pays for the MCP module's import (and any SDK client setup)
+    page_id = os.getenv('FACEBOOK_PAGE_ID', '')
+    if not page_id:
+        return None, None
+
     try:
         from AI_Employee.mcp_servers.facebook_mcp import get_engagement_summary
-        
-        page_id = os.getenv('FACEBOOK_PAGE_ID', '')
-        if page_id:
-            fb_data = get_engagement_summary(
-                page_id=page_id,
-                since=datetime.combine(period_start, datetime.min.time()).isoformat(),
-                until=datetime.combine(period_end, datetime.max.time()).isoformat()
-            )
-            
-            platforms.append(PlatformEngagement(
-                platform='facebook',
-                total_posts=0,  # Would need to get from get_page_posts
-                total_likes=fb_data.get('total_likes', 0),
-                total_comments=fb_data.get('total_comments', 0),
-                total_shares=fb_data.get('total_shares', 0),
-                total_impressions=fb_data.get('total_reach', 0),
-                total_reach=fb_data.get('total_reach', 0),
-                engagement_rate=fb_data.get('engagement_rate', 0.0),
-                follower_growth=0  # Would need separate API call
-            ))
+
+        fb_data = get_engagement_summary(
+            page_id=page_id,
+            since=since_iso,
+            until=until_iso
+        )
+
+        return PlatformEngagement(
+            platform='facebook',
+            total_posts=0,  # Would need to get from get_page_posts
+            total_likes=fb_data.get('total_likes', 0),
+            total_comments=fb_data.get('total_comments', 0),
+            total_shares=fb_data.get('total_shares', 0),
+            total_impressions=fb_data.get('total_reach', 0),
+            total_reach=fb_data.get('total_reach', 0),
+            engagement_rate=fb_data.get('engagement_rate', 0.0),
+            follower_growth=0  # Would need separate API call
+        ), None
     except Exception as e:
         logger.warning(f"Facebook data unavailable: {e}")
-        unavailable_platforms.append('facebook')
-    
-    # Instagram
+        return None, 'facebook'
+
+
+def _fetch_instagram(
+    since_iso: str,
+    until_iso: str
+) -> tuple[Optional[PlatformEngagement], Optional[str]]:
+    """Fetch Instagram engagement; returns (engagement, unavailable name)."""
+    instagram_business_id = os.getenv('INSTAGRAM_BUSINESS_ID', '')
+    if not instagram_business_id:
+        return None, None
+
     try:
-        from AI_Employee.mcp_servers.instagram_mcp import get_insights
-        
-        instagram_business_id = os.getenv('INSTAGRAM_BUSINESS_ID', '')
-        if instagram_business_id:
-            ig_insights = get_insights(
+        from AI_Employee.mcp_servers.instagram_mcp import get_insights, get_media
+
+        # Insights run on the pool while media pagination proceeds here
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            insights_future = pool.submit(
+                get_insights,
                 instagram_business_id=instagram_business_id,
                 metric="impressions,reach",
                 period="week",
-                since=datetime.combine(period_start, datetime.min.time()).isoformat(),
-                until=datetime.combine(period_end, datetime.max.time()).isoformat()
-            )
-            
-            # Get media for engagement
-            from AI_Employee.mcp_servers.instagram_mcp import get_media
-            media = get_media(
-                instagram_business_id=instagram_business_id,
-                limit=100
+                since=since_iso,
+                until=until_iso
             )
-            
-            total_likes = sum(m.get('like_count', 0) for m in media.get('media', []))
-            total_comments = sum(m.get('comments_count', 0) for m in media.get('media', []))
-            
-            platforms.append(PlatformEngagement(
-                platform='instagram',
-                total_posts=len(media.get('media', [])),
-                total_likes=total_likes,
-                total_comments=total_comments,
-                total_shares=0,  # Instagram doesn't have shares
-                total_impressions=0,  # Would come from insights
-                total_reach=0,  # Would come from insights
-                engagement_rate=0.0,
-                follower_growth=0
-            ))
+
+            # Media comes back newest-first, so paginate until a post
+            # predates the period instead of assuming one 100-item page
+            # covers the week. Tallies accumulate in a single pass per
+            # page rather than two list traversals at the end.
+            total_posts = 0
+            total_likes = 0
+            total_comments = 0
+            since_day = since_iso[:10]
+            after = ''
+            for _ in range(10):  # hard page cap as a runaway guard
+                media = get_media(
+                    instagram_business_id=instagram_business_id,
+                    limit=100,
+                    after=after
+                )
+                reached_period_start = False
+                for m in media.get('media', []):
+                    timestamp = m.get('timestamp', '')
+                    if timestamp and timestamp[:10] < since_day:
+                        reached_period_start = True
+                        break
+                    total_posts += 1
+                    total_likes += m.get('like_count', 0)
+                    total_comments += m.get('comments_count', 0)
+
+                after = media.get('after_cursor', '')
+                if reached_period_start or not after:
+                    break
+
+            insights_future.result()
+
+        return PlatformEngagement(
+            platform='instagram',
+            total_posts=total_posts,
+            total_likes=total_likes,
+            total_comments=total_comments,
+            total_shares=0,  # Instagram doesn't have shares
+            total_impressions=0,  # Would come from insights
+            total_reach=0,  # Would come from insights
+            engagement_rate=0.0,
+            follower_growth=0
+        ), None
     except Exception as e:
         logger.warning(f"Instagram data unavailable: {e}")
-        unavailable_platforms.append('instagram')
-    
-    # Twitter
+        return None, 'instagram'
+
+
+def _fetch_twitter(
+    since_iso: str,
+    until_iso: str
+) -> tuple[Optional[PlatformEngagement], Optional[str]]:
+    """Fetch Twitter engagement; returns (engagement, unavailable name)."""
+    user_id = os.getenv('TWITTER_USER_ID', '')
+    if not user_id:
+        return None, None
+
     try:
         from AI_Employee.mcp_servers.twitter_mcp import get_engagement_summary
-        
-        user_id = os.getenv('TWITTER_USER_ID', '')
-        if user_id:
-            twitter_data = get_engagement_summary(
-                user_id=user_id,
-                start_time=datetime.combine(period_start, datetime.min.time()).isoformat(),
-                end_time=datetime.combine(period_end, datetime.max.time()).isoformat()
-            )
-            
-            platforms.append(PlatformEngagement(
-                platform='twitter',
-                total_posts=twitter_data.get('total_tweets', 0),
-                total_likes=twitter_data.get('total_likes', 0),
-                total_comments=twitter_data.get('total_replies', 0),
-                total_shares=twitter_data.get('total_retweets', 0),
-                total_impressions=twitter_data.get('total_impressions', 0),
-                total_reach=twitter_data.get('total_impressions', 0),  # Twitter uses impressions
-                engagement_rate=twitter_data.get('engagement_rate', 0.0),
-                follower_growth=0  # Would need separate API call
-            ))
+
+        twitter_data = get_engagement_summary(
+            user_id=user_id,
+            start_time=since_iso,
+            end_time=until_iso
+        )
+
+        return PlatformEngagement(
+            platform='twitter',
+            total_posts=twitter_data.get('total_tweets', 0),
+            total_likes=twitter_data.get('total_likes', 0),
+            total_comments=twitter_data.get('total_replies', 0),
+            total_shares=twitter_data.get('total_retweets', 0),
+            total_impressions=twitter_data.get('total_impressions', 0),
+            total_reach=twitter_data.get('total_impressions', 0),  # Twitter uses impressions
+            engagement_rate=twitter_data.get('engagement_rate', 0.0),
+            follower_growth=0  # Would need separate API call
+        ), None
     except Exception as e:
         logger.warning(f"Twitter data unavailable: {e}")
-        unavailable_platforms.append('twitter')
-    
+        return None, 'twitter'
+
+
+def get_social_media_data(period_start: date, period_end: date) -> Optional[dict[str, Any]]:
+    """
+    Get social media engagement data from Facebook, Instagram, Twitter MCP servers.
+
+    The three platform fetches are independent network round-trips, so
+    they run concurrently; total wall time is roughly the slowest call
+    instead of the sum of all three.
+
+    Args:
+        period_start: Start date for engagement metrics
+        period_end: End date for engagement metrics
+
+    Returns:
+        Social media engagement data dictionary or None if unavailable
+    """
+    # Window bounds are identical for every platform; build the ISO
+    # strings once instead of per fetcher
+    since_iso = datetime.combine(period_start, datetime.min.time()).isoformat()
+    until_iso = datetime.combine(period_end, datetime.max.time()).isoformat()
+
+    fetchers = (_fetch_facebook, _fetch_instagram, _fetch_twitter)
+    with ThreadPoolExecutor(max_workers=len(fetchers)) as executor:
+        results = list(executor.map(
+            lambda fetch: fetch(since_iso, until_iso), fetchers
+        ))
+
+    platforms = [engagement for engagement, _ in results if engagement]
+    unavailable_platforms = [name for _, name in results if name]
+
     if not platforms:
         return None
     
@@ -269,77 +350,175 @@ def get_social_media_data(period_start: date, period_end: date) -> Optional[dict
     }
 
 
+def _parse_one_day(log_file: Path) -> dict[str, Any]:
+    """Parse a single daily log file into partial counters."""
+    partial: dict[str, Any] = {
+        'total': 0,
+        'success': 0,
+        'fail': 0,
+        'by_domain': Counter(),
+        'by_type': Counter(),
+        'duration': 0.0
+    }
+
+    try:
+        log_data = orjson.loads(log_file.read_bytes())
+    except Exception as e:
+        logger.warning(f"Failed to parse log file {log_file}: {e}")
+        return partial
+
+    if not isinstance(log_data, list):
+        return partial
+
+    # Counter.update aggregates each pass at C level instead of two
+    # dict lookups plus an insert per entry
+    partial['total'] = len(log_data)
+    results = Counter(entry.get('result', 'unknown') for entry in log_data)
+    partial['success'] = results['success']
+    partial['fail'] = results['failure']
+    partial['by_domain'].update(
+        entry.get('domain', 'unknown') for entry in log_data
+    )
+    partial['by_type'].update(
+        entry.get('action_type', 'unknown') for entry in log_data
+    )
+    partial['duration'] = sum(
+        entry.get('execution_duration_ms', 0) or 0 for entry in log_data
+    ) / 1000.0  # Convert to seconds
+
+    return partial
+
+
 def parse_action_logs(period_start: date, period_end: date) -> dict[str, Any]:
     """
     Parse action logs from /Logs/ for the specified period.
-    
+
+    The daily files are independent, so they parse on a thread pool:
+    the win is overlapping file reads (orjson itself holds the GIL for
+    the whole decode, so decoding stays serial). The partial counters
+    merge afterwards.
+
     Args:
         period_start: Start date for log parsing
         period_end: End date for log parsing
-    
+
     Returns:
         Action logs summary dictionary
     """
     logs_path = config.logs_path
+
+    # One directory scan replaces a per-day exists() stat probe
+    try:
+        existing = {p.stem: p for p in logs_path.glob('*.json')}
+    except OSError:
+        existing = {}
+
+    log_files = []
+    current_date = period_start
+    while current_date <= period_end:
+        log_file = existing.get(current_date.isoformat())
+        if log_file is not None:
+            log_files.append(log_file)
+        current_date += timedelta(days=1)
+
     total_actions = 0
     successful_actions = 0
     failed_actions = 0
-    actions_by_domain = {}
-    actions_by_type = {}
+    actions_by_domain: Counter[str] = Counter()
+    actions_by_type: Counter[str] = Counter()
     total_processing_time = 0.0
-    
-    # Iterate through log files in the period
-    current_date = period_start
-    while current_date <= period_end:
-        log_file = logs_path / f"{current_date.isoformat()}.json"
-        
-        if log_file.exists():
-            try:
-                with open(log_file, 'r', encoding='utf-8') as f:
-                    log_data = json.load(f)
-                    
-                    if isinstance(log_data, list):
-                        for entry in log_data:
-                            total_actions += 1
-                            
-                            # Track by result
-                            result = entry.get('result', 'unknown')
-                            if result == 'success':
-                                successful_actions += 1
-                            elif result == 'failure':
-                                failed_actions += 1
-                            
-                            # Track by domain
-                            domain = entry.get('domain', 'unknown')
-                            actions_by_domain[domain] = actions_by_domain.get(domain, 0) + 1
-                            
-                            # Track by type
-                            action_type = entry.get('action_type', 'unknown')
-                            actions_by_type[action_type] = actions_by_type.get(action_type, 0) + 1
-                            
-                            # Track processing time
-                            duration = entry.get('execution_duration_ms', 0)
-                            if duration:
-                                total_processing_time += duration / 1000.0  # Convert to seconds
-            except Exception as e:
-                logger.warning(f"Failed to parse log file {log_file}: {e}")
-        
-        current_date += timedelta(days=1)
-    
+
+    if log_files:
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            for partial in executor.map(_parse_one_day, log_files):
+                total_actions += partial['total']
+                successful_actions += partial['success']
+                failed_actions += partial['fail']
+                actions_by_domain += partial['by_domain']
+                actions_by_type += partial['by_type']
+                total_processing_time += partial['duration']
+
     # Calculate success rate
     success_rate = (successful_actions / total_actions * 100.0) if total_actions > 0 else 0.0
     avg_processing_time = (total_processing_time / total_actions) if total_actions > 0 else 0.0
-    
+
     return {
         'total_actions': total_actions,
-        'actions_by_domain': actions_by_domain,
-        'actions_by_type': actions_by_type,
+        'actions_by_domain': dict(actions_by_domain),
+        'actions_by_type': dict(actions_by_type),
         'success_rate': success_rate,
         'failed_actions': failed_actions,
         'average_processing_time_seconds': avg_processing_time
     }
 
 
+@functools.lru_cache(maxsize=4)
+def _get_groq_client(api_key: str) -> Groq:
+    """One Groq client per key, so its HTTP connection pool is reused
+    across the audit and briefing phases instead of re-handshaking."""
+    return Groq(api_key=api_key)
+
+
+def _summarize_financials(financial_data: Optional[dict]) -> str:
+    """Flatten financial data to a short key=value line for the prompt."""
+    if not financial_data:
+        return '[DATA UNAVAILABLE: Xero]'
+    return (
+        f"revenue={financial_data.get('revenue', 0.0):.0f} "
+        f"expenses={financial_data.get('expenses', 0.0):.0f} "
+        f"net_profit={financial_data.get('net_profit', 0.0):.0f} "
+        f"margin={financial_data.get('profit_margin', 0.0):.1f}% "
+        f"outstanding_invoices={financial_data.get('outstanding_invoices', 0)} "
+        f"outstanding_amount={financial_data.get('outstanding_invoice_amount', 0.0):.0f} "
+        f"currency={financial_data.get('currency', 'USD')}"
+    )
+
+
+def _summarize_social_media(social_media_data: Optional[dict]) -> str:
+    """Flatten per-platform engagement to one short line per platform."""
+    if not social_media_data:
+        return '[DATA UNAVAILABLE: Social Media]'
+    lines = []
+    for platform in social_media_data.get('platforms', []):
+        lines.append(
+            f"{platform.get('platform', '?')}: "
+            f"posts={platform.get('total_posts', 0)} "
+            f"likes={platform.get('total_likes', 0)} "
+            f"comments={platform.get('total_comments', 0)} "
+            f"shares={platform.get('total_shares', 0)} "
+            f"reach={platform.get('total_reach', 0)} "
+            f"rate={platform.get('engagement_rate', 0.0):.2f}%"
+        )
+    lines.append(
+        f"overall: posts={social_media_data.get('total_posts', 0)} "
+        f"engagement={social_media_data.get('total_engagement', 0)} "
+        f"rate={social_media_data.get('overall_engagement_rate', 0.0):.2f}%"
+    )
+    unavailable = social_media_data.get('unavailable_platforms', [])
+    if unavailable:
+        lines.append(f"unavailable: {', '.join(unavailable)}")
+    return '; '.join(lines)
+
+
+def _summarize_action_logs(action_logs_summary: dict) -> str:
+    """Flatten the action log summary to a short key=value line."""
+    by_domain = action_logs_summary.get('actions_by_domain', {})
+    top_domain = max(by_domain, key=by_domain.get) if by_domain else 'none'
+    return (
+        f"actions={action_logs_summary.get('total_actions', 0)} "
+        f"success_rate={action_logs_summary.get('success_rate', 0.0):.1f}% "
+        f"failed={action_logs_summary.get('failed_actions', 0)} "
+        f"top_domain={top_domain} "
+        f"avg_time={action_logs_summary.get('average_processing_time_seconds', 0.0):.2f}s"
+    )
+
+
+def _insights_cache_path(prompt: str) -> Path:
+    """On-disk memo location for a given insights prompt."""
+    digest = hashlib.sha256(prompt.encode('utf-8')).hexdigest()[:32]
+    return config.system_path / 'Groq_Cache' / f"{digest}.json"
+
+
 def generate_ai_insights(
     financial_data: Optional[dict],
     social_media_data: Optional[dict],
@@ -360,6 +539,25 @@ def generate_ai_insights(
     Returns:
         Dictionary with executive_summary, key_insights, recommendations, risks_and_alerts
     """
+    # No-op week fast path: with nothing collected there is nothing
+    # for the LLM to analyze, so skip the network round trip entirely
+    has_any = (
+        bool(financial_data)
+        or bool(social_media_data)
+        or action_logs_summary.get('total_actions', 0) > 0
+    )
+    if not has_any:
+        logger.info("No data collected for period, skipping AI insights")
+        return {
+            'executive_summary': f"Week of {period_start} to {period_end}: No financial, social media, or action log data was collected this period. [AI insights skipped - no data to analyze]",
+            'key_insights': [
+                "No business activity recorded for the reporting period",
+                "Verify watchers and integrations are running if activity was expected"
+            ],
+            'recommendations': [],
+            'risks_and_alerts': []
+        }
+
     api_key = os.getenv('GROQ_API_KEY', '')
     if not api_key:
         logger.warning("GROQ_API_KEY not configured, skipping AI insights")
@@ -375,7 +573,7 @@ def generate_ai_insights(
         }
 
     try:
-        client = Groq(api_key=api_key)
+        client = _get_groq_client(api_key)
 
         # Build prompt
         prompt = f"""Analyze this business week data ({period_start} to {period_end}) and generate:
@@ -386,9 +584,9 @@ def generate_ai_insights(
 4. Risks and Alerts (list any critical issues): Any anomalies, overdue items, or concerns requiring attention
 
 Data:
-- Financial: {json.dumps(financial_data, default=str) if financial_data else '[DATA UNAVAILABLE: Xero]'}
-- Social Media: {json.dumps(social_media_data, default=str) if social_media_data else '[DATA UNAVAILABLE: Social Media]'}
-- Action Logs: {json.dumps(action_logs_summary, default=str)}
+- Financial: {_summarize_financials(financial_data)}
+- Social Media: {_summarize_social_media(social_media_data)}
+- Action Logs: {_summarize_action_logs(action_logs_summary)}
 
 Format your response as JSON:
 {{
@@ -399,6 +597,18 @@ Format your response as JSON:
 }}
 """
 
+        # Identical prompt (same period, same data) was already
+        # answered - the 10 AM briefing reuses the 9 AM audit's result
+        # instead of paying another LLM round trip
+        cache_file = _insights_cache_path(prompt)
+        if cache_file.exists():
+            try:
+                cached = json.loads(cache_file.read_text(encoding='utf-8'))
+                logger.info("Using cached AI insights")
+                return cached
+            except (json.JSONDecodeError, OSError) as e:
+                logger.warning(f"Ignoring corrupt insights cache: {e}")
+
         response = client.chat.completions.create(
             model=os.getenv('GROQ_MODEL', 'llama-3.3-70b-versatile'),
             messages=[
@@ -412,30 +622,29 @@ Format your response as JSON:
                 }
             ],
             temperature=0.5,
-            max_tokens=2000
+            max_tokens=2000,
+            # JSON mode guarantees a bare JSON object, so no markdown
+            # fence stripping is needed on the response
+            response_format={"type": "json_object"}
         )
 
-        # Parse JSON response
-        response_text = response.choices[0].message.content
-        # Extract JSON from markdown code blocks if present
-        if "```json" in response_text:
-            json_start = response_text.find("```json") + 7
-            json_end = response_text.find("```", json_start)
-            response_text = response_text[json_start:json_end].strip()
-        elif "```" in response_text:
-            json_start = response_text.find("```") + 3
-            json_end = response_text.find("```", json_start)
-            response_text = response_text[json_start:json_end].strip()
-
-        insights = json.loads(response_text)
+        insights = json.loads(response.choices[0].message.content)
 
-        return {
+        result = {
             'executive_summary': insights.get('executive_summary', ''),
             'key_insights': insights.get('key_insights', []),
             'recommendations': insights.get('recommendations', []),
             'risks_and_alerts': insights.get('risks_and_alerts', [])
         }
 
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            cache_file.write_text(json.dumps(result), encoding='utf-8')
+        except OSError as e:
+            logger.warning(f"Failed to cache AI insights: {e}")
+
+        return result
+
     except Exception as e:
         logger.error(f"Failed to generate AI insights: {e}")
         return {
@@ -713,6 +922,14 @@ def run_audit_phase(period_start: date, period_end: date) -> AuditReport:
     audit_file.parent.mkdir(parents=True, exist_ok=True)
     audit_file.write_text(audit_report.model_dump_json(), encoding='utf-8')
     logger.info(f"✅ Audit report saved to {audit_file}")
+
+    # Persist the insights next to the report so the briefing phase
+    # can reuse them instead of paying a second Groq call
+    insights_file = audit_file.with_name(f"{period_start.isoformat()}-insights.json")
+    try:
+        insights_file.write_text(json.dumps(ai_insights), encoding='utf-8')
+    except OSError as e:
+        logger.warning(f"Failed to save insights file: {e}")
     
     # Update dashboard
     try:
@@ -728,20 +945,27 @@ def run_audit_phase(period_start: date, period_end: date) -> AuditReport:
     return audit_report
 
 
-def run_briefing_phase(period_start: date, period_end: date, audit_report: Optional[AuditReport] = None) -> CEOBriefing:
+def run_briefing_phase(
+    period_start: date,
+    period_end: date,
+    audit_report: Optional[AuditReport] = None,
+    refresh_insights: bool = False
+) -> CEOBriefing:
     """
     Run the CEO briefing phase (10 AM).
-    
+
     Args:
         period_start: Period start date
         period_end: Period end date
         audit_report: Optional pre-generated audit report
-    
+        refresh_insights: Regenerate AI insights even if the audit
+            phase already saved them
+
     Returns:
         Generated CEOBriefing
     """
     logger.info(f"Starting CEO briefing phase for period {period_start} to {period_end}")
-    
+
     # Load audit report if not provided
     if audit_report is None:
         audit_file = config.accounting_path / 'Audits' / f"{period_start.isoformat()}-audit-report.json"
@@ -750,20 +974,34 @@ def run_briefing_phase(period_start: date, period_end: date, audit_report: Optio
         else:
             logger.warning("Audit report not found, running audit phase first...")
             audit_report = run_audit_phase(period_start, period_end)
-    
-    # Regenerate AI insights for briefing (may have different focus)
-    financial_data = audit_report.financial_data
-    social_media_data = audit_report.social_media_data
-    action_logs_summary = audit_report.action_logs_summary
-    
-    logger.info("Generating AI insights for CEO briefing...")
-    ai_insights = generate_ai_insights(
-        financial_data,
-        social_media_data,
-        action_logs_summary,
-        period_start,
-        period_end
+
+    # Reuse the audit phase's insights when available - the inputs are
+    # identical, so regenerating would just repeat the Groq call
+    ai_insights = None
+    insights_file = (
+        config.accounting_path / 'Audits'
+        / f"{period_start.isoformat()}-insights.json"
     )
+    if not refresh_insights and insights_file.exists():
+        try:
+            ai_insights = json.loads(insights_file.read_text(encoding='utf-8'))
+            logger.info("Reusing AI insights from audit phase")
+        except (json.JSONDecodeError, OSError) as e:
+            logger.warning(f"Ignoring unreadable insights file: {e}")
+
+    if ai_insights is None:
+        financial_data = audit_report.financial_data
+        social_media_data = audit_report.social_media_data
+        action_logs_summary = audit_report.action_logs_summary
+
+        logger.info("Generating AI insights for CEO briefing...")
+        ai_insights = generate_ai_insights(
+            financial_data,
+            social_media_data,
+            action_logs_summary,
+            period_start,
+            period_end
+        )
     
     logger.info("Generating CEO briefing...")
     briefing = generate_ceo_briefing(
@@ -812,7 +1050,12 @@ def main():
         type=str,
         help='Period end date (YYYY-MM-DD, defaults to Sunday of current week)'
     )
-    
+    parser.add_argument(
+        '--refresh-insights',
+        action='store_true',
+        help='Regenerate AI insights for the briefing even if the audit phase saved them'
+    )
+
     args = parser.parse_args()
     
     # Determine period
@@ -831,7 +1074,12 @@ def main():
             audit_report = None
         
         if args.phase in ['briefing', 'all']:
-            briefing = run_briefing_phase(period_start, period_end, audit_report)
+            briefing = run_briefing_phase(
+                period_start,
+                period_end,
+                audit_report,
+                refresh_insights=args.refresh_insights
+            )
         
         logger.info("✅ Weekly audit completed successfully")
         
@@ -0,0 +1,128 @@
+"""
+Unit tests for approval request frontmatter round-trips.
+
+Verifies that every scalar _yaml_scalar emits parses back as the
+identical string under yaml.safe_load - in particular the YAML 1.1
+bool/null lexemes (yes/no/on/off/~ and case variants) and number-like
+values, which must be quoted or the orchestrator's YAML validation
+re-types them - and that approval_from_frontmatter rebuilds requests
+from the parsed dict without coercing re-typed values.
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+import yaml
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from models.approval_request import (
+    ApprovalRequest,
+    _yaml_scalar,
+    approval_from_frontmatter,
+)
+
+# Values that historically round-tripped as bool/None/int instead of
+# their original string, plus ordinary scalars that must stay intact.
+# Frontmatter scalars are single-line by construction.
+ROUNDTRIP_VALUES = [
+    'yes', 'No', 'ON', 'off', 'TRUE', 'False', 'Null', 'NULL', '~',
+    'y', 'n', '=', '.inf', '.NaN', '+5', '123', '1.5', '0x1F',
+    'plain', 'hello world', 'user@example.com', 'LinkedIn Profile',
+    'v1.2.3', 'True story', 'yesterday', 'nothing', 'online',
+    'say "hi"', 'a\\b', 'key: value', '# comment',
+]
+
+
+class TestYamlScalarRoundtrip(unittest.TestCase):
+    """Tests for _yaml_scalar quoting decisions."""
+
+    def test_scalars_roundtrip_identically(self):
+        """Every emitted scalar must safe_load back as the same string."""
+        for value in ROUNDTRIP_VALUES:
+            with self.subTest(value=value):
+                loaded = yaml.safe_load(f"field: {_yaml_scalar(value)}")
+                self.assertEqual(loaded['field'], value)
+
+    def test_reserved_lexemes_are_quoted(self):
+        """YAML 1.1 bool/null lexemes never go out bare."""
+        for value in ('yes', 'No', 'ON', 'off', 'TRUE', 'Null', '~'):
+            with self.subTest(value=value):
+                self.assertTrue(_yaml_scalar(value).startswith('"'))
+
+    def test_plain_words_stay_unquoted(self):
+        """Words merely containing a reserved prefix are unchanged."""
+        for value in ('yesterday', 'nothing', 'online', 'plain'):
+            with self.subTest(value=value):
+                self.assertEqual(_yaml_scalar(value), value)
+
+
+class TestFrontmatterRoundtrip(unittest.TestCase):
+    """Tests for full frontmatter generation and re-parsing."""
+
+    def _load_frontmatter(self, approval):
+        """Generate frontmatter and parse it back with safe_load."""
+        frontmatter = approval.to_frontmatter()
+        body = frontmatter.strip().strip('-').strip()
+        return frontmatter, yaml.safe_load(body)
+
+    def test_fields_survive_safe_load(self):
+        """Target and rationale survive a safe_load round-trip."""
+        for value in ROUNDTRIP_VALUES:
+            with self.subTest(value=value):
+                approval = ApprovalRequest(target=value, rationale=value)
+                _, data = self._load_frontmatter(approval)
+                self.assertEqual(data['target'], value)
+                self.assertEqual(data['rationale'], value)
+
+    def test_bytes_path_matches_str_path(self):
+        """to_frontmatter_bytes stays byte-identical to to_frontmatter."""
+        for value in ('yes', '+5', 'plain', 'say "hi"'):
+            with self.subTest(value=value):
+                approval = ApprovalRequest(target=value)
+                self.assertEqual(
+                    approval.to_frontmatter_bytes().decode('utf-8'),
+                    approval.to_frontmatter()
+                )
+
+    def test_rebuild_preserves_values(self):
+        """approval_from_frontmatter gets the original strings back."""
+        approval = ApprovalRequest(
+            target='yes',
+            rationale='On',
+            mcp_server='email-mcp',
+            mcp_tool='send_email'
+        )
+        _, data = self._load_frontmatter(approval)
+        rebuilt = approval_from_frontmatter(data)
+        self.assertIsNotNone(rebuilt)
+        self.assertEqual(rebuilt.target, 'yes')
+        self.assertEqual(rebuilt.rationale, 'On')
+        self.assertEqual(rebuilt.id, approval.id)
+        self.assertEqual(
+            rebuilt.created_timestamp, approval.created_timestamp
+        )
+
+    def test_rebuild_rejects_retyped_values(self):
+        """A bool where a string belongs rejects the file, no coercion."""
+        data = {
+            'id': 'abc',
+            'action_type': 'email_send',
+            'target': True,  # e.g. hand-edited frontmatter 'target: yes'
+            'mcp_server': 'email-mcp',
+            'created_timestamp': '2026-08-29T09:00:00'
+        }
+        self.assertIsNone(approval_from_frontmatter(data))
+
+    def test_rebuild_stringifies_bare_numbers(self):
+        """Ints and floats stringify losslessly instead of rejecting."""
+        data = {'id': 12345, 'target': 'x'}
+        rebuilt = approval_from_frontmatter(data)
+        self.assertIsNotNone(rebuilt)
+        self.assertEqual(rebuilt.id, '12345')
+
+
+if __name__ == '__main__':
+    unittest.main()
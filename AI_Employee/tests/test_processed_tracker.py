@@ -0,0 +1,145 @@
+"""
+Unit tests for ProcessedTracker persistence.
+
+Covers the snapshot + append-only log format: replay after a crash
+mid-write (torn tail line), compaction round-trip, and loading the
+legacy snapshot format where content hashes were stored as dicts.
+"""
+
+import json
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from models.processed_tracker import ProcessedTracker
+
+
+class TestProcessedTrackerPersistence(unittest.TestCase):
+    """Tests for snapshot, log replay and compaction."""
+
+    def setUp(self):
+        """Set up a temporary tracker location."""
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.tracker_path = self.test_dir / 'processed.json'
+        self.log_path = self.tracker_path.with_suffix('.log')
+
+    def tearDown(self):
+        """Clean up temporary files."""
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def _close(self, tracker):
+        """Release the tracker's open log handle."""
+        if tracker._log_file is not None:
+            tracker._log_file.close()
+            tracker._log_file = None
+
+    def test_log_replay_restores_state(self):
+        """Mutations logged since the last snapshot survive a reload."""
+        tracker = ProcessedTracker(self.tracker_path)
+        tracker.mark_processed('msg-1', 'gmail')
+        tracker.mark_processed('msg-2', 'gmail')
+        tracker.mark_processed('file-1', 'file')
+        tracker.unmark_processed('msg-2', 'gmail')
+        tracker.register_content_hash('abc123', 'gmail', 'msg-1', 'Action.md')
+        self._close(tracker)
+
+        reloaded = ProcessedTracker(self.tracker_path)
+        self.assertTrue(reloaded.is_processed('msg-1', 'gmail'))
+        self.assertFalse(reloaded.is_processed('msg-2', 'gmail'))
+        self.assertTrue(reloaded.is_processed('file-1', 'file'))
+        self.assertEqual(reloaded.get_processed_count('gmail'), 1)
+        self.assertEqual(reloaded.get_processed_count('file'), 1)
+        self.assertEqual(
+            reloaded.is_duplicate_content('abc123'), (True, 'Action.md')
+        )
+        self._close(reloaded)
+
+    def test_replay_skips_torn_tail_line(self):
+        """A crash mid-append leaves a partial line that replay skips."""
+        tracker = ProcessedTracker(self.tracker_path)
+        tracker.mark_processed('msg-1', 'gmail')
+        tracker.mark_processed('msg-2', 'gmail')
+        self._close(tracker)
+
+        # Simulate a crash that tore the final write in half
+        with open(self.log_path, 'a', encoding='utf-8') as f:
+            f.write('{"op": "mark", "source": "gm')
+
+        reloaded = ProcessedTracker(self.tracker_path)
+        self.assertTrue(reloaded.is_processed('msg-1', 'gmail'))
+        self.assertTrue(reloaded.is_processed('msg-2', 'gmail'))
+        self.assertEqual(reloaded.get_processed_count('gmail'), 2)
+        self._close(reloaded)
+
+    def test_compaction_roundtrip(self):
+        """Compaction folds the log into the snapshot without data loss."""
+        tracker = ProcessedTracker(self.tracker_path)
+        for i in range(5):
+            tracker.mark_processed(f'msg-{i}', 'gmail')
+        tracker.mark_processed('chat-1', 'whatsapp')
+        tracker.register_content_hash('feed00', 'whatsapp', 'chat-1', 'Plan.md')
+        tracker.compact()
+
+        self.assertTrue(self.tracker_path.exists())
+        self.assertFalse(self.log_path.exists())
+
+        reloaded = ProcessedTracker(self.tracker_path)
+        for i in range(5):
+            self.assertTrue(reloaded.is_processed(f'msg-{i}', 'gmail'))
+        self.assertTrue(reloaded.is_processed('chat-1', 'whatsapp'))
+        self.assertEqual(reloaded.get_processed_count('gmail'), 5)
+        self.assertEqual(
+            reloaded.get_content_hash_info('feed00'),
+            {'source': 'whatsapp', 'item_id': 'chat-1', 'action_file': 'Plan.md'}
+        )
+        self._close(reloaded)
+
+    def test_legacy_snapshot_format_loads(self):
+        """Old snapshots stored content hashes as dicts, not tuples."""
+        legacy = {
+            'gmail': ['msg-1'],
+            'file': [],
+            'whatsapp': [],
+            'linkedin': ['post-1'],
+            'content_hashes': {
+                'cafe01': {
+                    'source': 'gmail',
+                    'item_id': 'msg-1',
+                    'action_file': 'Old.md'
+                }
+            }
+        }
+        self.tracker_path.write_text(json.dumps(legacy), encoding='utf-8')
+
+        tracker = ProcessedTracker(self.tracker_path)
+        self.assertTrue(tracker.is_processed('msg-1', 'gmail'))
+        self.assertTrue(tracker.is_processed('post-1', 'linkedin'))
+        self.assertEqual(tracker.is_duplicate_content('cafe01'), (True, 'Old.md'))
+        self.assertEqual(
+            tracker.get_content_hash_info('cafe01'),
+            {'source': 'gmail', 'item_id': 'msg-1', 'action_file': 'Old.md'}
+        )
+
+        # A compaction after a legacy load keeps the migrated entries
+        tracker.mark_processed('msg-2', 'gmail')
+        tracker.compact()
+        reloaded = ProcessedTracker(self.tracker_path)
+        self.assertEqual(reloaded.is_duplicate_content('cafe01'), (True, 'Old.md'))
+        self.assertEqual(reloaded.get_processed_count('gmail'), 2)
+        self._close(reloaded)
+
+    def test_corrupt_snapshot_starts_fresh(self):
+        """A torn snapshot is dropped instead of crashing the watcher."""
+        self.tracker_path.write_text('{"gmail": ["msg-1"', encoding='utf-8')
+        tracker = ProcessedTracker(self.tracker_path)
+        self.assertFalse(tracker.is_processed('msg-1', 'gmail'))
+        self.assertEqual(tracker.get_processed_count('gmail'), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -377,6 +377,53 @@ class AuditLogger:
             approval_request_id=approval_request_id
         )
 
+    def log_approval_workflow_batch(
+        self,
+        events: list[tuple[str, str, str | None]]
+    ) -> list[str]:
+        """
+        Log several approval workflow transitions in one write.
+
+        The day's log file is loaded and rewritten once for the whole
+        batch instead of once per event, amortizing the atomic-write
+        cost across callers that queue events up.
+
+        Args:
+            events: (action_type, approval_request_id, approver) tuples.
+
+        Returns:
+            The entry_ids of the logged entries, in input order.
+        """
+        if not events:
+            return []
+
+        new_entries: list[dict[str, Any]] = []
+        for action_type, approval_request_id, approver in events:
+            entry = self._create_entry(
+                action_type=action_type,  # type: ignore[arg-type]
+                actor='system',
+                target=approval_request_id,
+                parameters={'approval_request_id': approval_request_id},
+                approval_status='not_required',
+                approval_by=approver,
+                approval_timestamp=datetime.now(timezone.utc),
+                approval_request_id=approval_request_id
+            )
+
+            is_valid, validation_errors = self.validate_entry(entry)
+            if not is_valid:
+                raise ValueError(
+                    f"Invalid audit log entry: {', '.join(validation_errors)}"
+                )
+            new_entries.append(entry)
+
+        log_path = self._get_log_file_path()
+        entries = self._load_log_entries(log_path)
+        entries.extend(new_entries)
+        self._write_log_atomically(log_path, entries)
+
+        return [entry['entry_id'] for entry in new_entries]
+
     def get_entries(
         self,
         date: datetime | None = None,
@@ -4,13 +4,16 @@ MCP Server Health Checker (Gold Tier)
 Monitors health and availability of MCP servers.
 """
 
-import json
 import time
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Callable, Optional
 
-from ..models.mcp_server_status import MCPServerStatus
+from ..models.mcp_server_status import (
+    MCPServerStatus,
+    dump_status_bytes,
+    load_status_bytes,
+)
 
 
 class HealthChecker:
@@ -59,8 +62,7 @@ class HealthChecker:
         # Load existing status or create new
         if status_file.exists():
             try:
-                status_data = json.loads(status_file.read_text(encoding='utf-8'))
-                status = MCPServerStatus.model_validate(status_data)
+                status = load_status_bytes(status_file.read_bytes())
             except Exception as e:
                 # If loading fails, create new status
                 print(f"Warning: Failed to load status for {server_name}: {e}")
@@ -97,7 +99,7 @@ class HealthChecker:
     def _save_status(self, status: MCPServerStatus) -> None:
         """Save MCP server status to file."""
         status_file = self.status_dir / f"{status.server_name}.json"
-        status_file.write_text(status.model_dump_json(), encoding='utf-8')
+        status_file.write_bytes(dump_status_bytes(status))
     
     def get_server_status(self, server_name: str) -> Optional[MCPServerStatus]:
         """
@@ -115,8 +117,7 @@ class HealthChecker:
             return None
         
         try:
-            status_data = json.loads(status_file.read_text(encoding='utf-8'))
-            return MCPServerStatus.model_validate(status_data)
+            return load_status_bytes(status_file.read_bytes())
         except Exception as e:
             print(f"Warning: Failed to load status for {server_name}: {e}")
             return None